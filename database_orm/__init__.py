@@ -14,13 +14,14 @@ EMBEDDING ARCHITECTURE:
 """
 
 from database_orm.models import Item, Analysis, Base
-from database_orm.connection import get_session, get_engine, init_connection
+from database_orm.connection import get_session, read_only_session, get_engine, init_connection
 
 __all__ = [
     "Item",
     "Analysis",
     "Base",
     "get_session",
+    "read_only_session",
     "get_engine",
     "init_connection",
 ]
@@ -0,0 +1,218 @@
+"""
+Bulk loading helpers for ORM tables.
+
+Provides:
+- PostgreSQL COPY ... FROM STDIN for large batches (one permission/type
+  check per batch, rows streamed straight into the heap)
+- Batched executemany INSERT below COPY_THRESHOLD or on other dialects
+- Offline initial loads from CSV files with secondary indexes dropped and
+  rebuilt once at the end (initial_load)
+
+COPY does not return rows, so callers that need server-generated values
+(timestamps, versions) must supply them in the row mappings.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Connection, Engine, Index, insert, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex
+
+# Batches smaller than this use executemany; COPY setup isn't worth it
+COPY_THRESHOLD = int(os.getenv("DB_COPY_THRESHOLD", "100"))
+
+# NULL marker for CSV COPY (unquoted \N; a quoted "\N" stays a string)
+_COPY_NULL = r"\N"
+
+# Characters read per write when feeding psycopg 3's COPY writer
+_COPY_BLOCK_SIZE = 64 * 1024
+
+
+def _copy_value(value: Any) -> Any:
+    """Format a Python value as a CSV COPY field."""
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (dict, list)):
+        # Compact separators: fewer bytes to stream and for the server to parse
+        return json.dumps(value, separators=(",", ":"))
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def copy_buffer(rows: Iterable[dict], columns: Sequence[str]) -> io.StringIO:
+    """
+    Serialize row mappings as CSV for COPY ... FROM STDIN.
+
+    Args:
+        rows: Row mappings keyed by column name
+        columns: Column order to write
+
+    Returns:
+        StringIO positioned at the start
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+    for row in rows:
+        writer.writerow([_copy_value(row.get(column)) for column in columns])
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_from(connection: Connection, sql: str, source) -> int:
+    """
+    Run COPY ... FROM STDIN on the connection's DBAPI cursor.
+
+    psycopg2 streams a file-like object via copy_expert; psycopg 3 has no
+    copy_expert and takes the data through a cursor.copy() writer instead.
+
+    Returns:
+        Rows copied, as reported by the driver
+    """
+    cursor = connection.connection.cursor()
+    try:
+        if connection.dialect.driver == "psycopg":
+            with cursor.copy(sql) as copy:
+                while block := source.read(_COPY_BLOCK_SIZE):
+                    copy.write(block)
+        else:
+            cursor.copy_expert(sql, source)
+        return cursor.rowcount
+    finally:
+        cursor.close()
+
+
+def bulk_insert(session: Session, model, rows: list[dict]) -> int:
+    """
+    Insert row mappings into a model's table in the session's transaction.
+
+    Uses COPY on PostgreSQL for batches of COPY_THRESHOLD rows or more, and
+    an executemany INSERT otherwise. No ORM instances are constructed, so
+    the identity map and ORM events are intentionally skipped; on the COPY
+    path Python-side column defaults are skipped too.
+
+    Args:
+        session: Session whose transaction receives the rows
+        model: ORM model class (e.g. Item, Analysis)
+        rows: Row mappings keyed by column name
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    connection = session.connection()
+    if connection.dialect.name != "postgresql" or len(rows) < COPY_THRESHOLD:
+        session.execute(insert(model), rows)
+        return len(rows)
+
+    table = model.__table__
+    columns = [column.name for column in table.columns if column.name in rows[0]]
+    sql = (
+        f"COPY {table.name} ({', '.join(columns)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+    )
+
+    _copy_from(connection, sql, copy_buffer(rows, columns))
+    return len(rows)
+
+
+def secondary_indexes(*models) -> list[Index]:
+    """
+    Indexes declared on the models' tables, excluding primary keys.
+
+    Only indexes known to the ORM metadata are returned; indexes created
+    solely in migrations (e.g. the trigram indexes) are left in place.
+    """
+    return [
+        index
+        for model in models
+        for index in sorted(model.__table__.indexes, key=lambda i: i.name)
+    ]
+
+
+def drop_secondary_indexes(connection: Connection, *models) -> list[Index]:
+    """
+    Drop the models' secondary indexes.
+
+    Returns:
+        The dropped indexes, for recreate_secondary_indexes
+    """
+    indexes = secondary_indexes(*models)
+    for index in indexes:
+        connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+    return indexes
+
+
+def recreate_secondary_indexes(connection: Connection, indexes: list[Index]) -> None:
+    """
+    Build indexes from their metadata definitions (one sort per index).
+    """
+    for index in indexes:
+        connection.execute(CreateIndex(index, if_not_exists=True))
+
+
+def copy_csv_file(connection: Connection, model, path: str) -> int:
+    """
+    Stream a CSV file with a header row into a model's table via COPY.
+
+    The header names the columns; unquoted \\N fields are NULL.
+
+    Returns:
+        Number of rows copied
+    """
+    table = model.__table__
+    with open(path, newline="") as f:
+        columns = next(csv.reader(f))
+        f.seek(0)
+        sql = (
+            f"COPY {table.name} ({', '.join(columns)}) "
+            f"FROM STDIN WITH (FORMAT csv, HEADER true, NULL '{_COPY_NULL}')"
+        )
+        return _copy_from(connection, sql, f)
+
+
+def initial_load(engine: Engine, files: Sequence[tuple[Any, str]]) -> dict[str, int]:
+    """
+    Load CSV files into empty or offline tables (PostgreSQL only).
+
+    Drops the secondary indexes of every loaded table, COPYs each file in
+    order (parents before children), rebuilds the indexes once and runs
+    ANALYZE, all in one transaction with statement_timeout lifted. Building
+    an index after the load is a single sort instead of one B-tree insert
+    per row.
+
+    NOT safe for live multi-writer use: the tables are unindexed until
+    commit, and CREATE INDEX blocks writes while it runs.
+
+    Args:
+        engine: PostgreSQL engine
+        files: (model, csv_path) pairs, e.g. [(Item, "items.csv"),
+            (Analysis, "analyses.csv")]
+
+    Returns:
+        Rows copied per table name
+    """
+    if engine.dialect.name != "postgresql":
+        raise ValueError("initial_load requires PostgreSQL (COPY)")
+
+    models = list(dict.fromkeys(model for model, _ in files))
+    counts = {}
+    with engine.begin() as connection:
+        # The app engine fences queries with statement_timeout; a large COPY,
+        # index build or ANALYZE would be cancelled and roll back the load
+        connection.execute(text("SET LOCAL statement_timeout = 0"))
+        indexes = drop_secondary_indexes(connection, *models)
+        for model, path in files:
+            table_name = model.__table__.name
+            counts[table_name] = counts.get(table_name, 0) + copy_csv_file(connection, model, path)
+        recreate_secondary_indexes(connection, indexes)
+        for model in models:
+            connection.execute(text(f"ANALYZE {model.__table__.name}"))
+    return counts
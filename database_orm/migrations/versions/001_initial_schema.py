@@ -15,6 +15,7 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from pgvector.sqlalchemy import Vector
 
 # revision identifiers, used by Alembic.
 revision: str = '001'
@@ -77,7 +78,7 @@ def upgrade() -> None:
         sa.Column('item_id', sa.String(), nullable=False),
         sa.Column('analysis_id', sa.String(), nullable=False),
         sa.Column('user_id', sa.String(), nullable=False),
-        sa.Column('vector', postgresql.ARRAY(sa.Float(), dimensions=1024), nullable=True),  # Will be converted to vector type
+        sa.Column('vector', Vector(1024), nullable=True),
         sa.Column('embedding_model', sa.String(), nullable=False),
         sa.Column('embedding_dimensions', sa.Integer(), nullable=False),
         sa.Column('embedding_source', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
@@ -90,9 +91,6 @@ def upgrade() -> None:
     op.create_index('ix_embeddings_analysis_id', 'embeddings', ['analysis_id'])
     op.create_index('ix_embeddings_user_id', 'embeddings', ['user_id'])
 
-    # Convert vector column to proper pgvector type
-    op.execute('ALTER TABLE embeddings ALTER COLUMN vector TYPE vector(1024) USING vector::vector(1024)')
-
     # Create tsvector update function for full-text search
     op.execute("""
         CREATE OR REPLACE FUNCTION analyses_search_vector_update() RETURNS trigger AS $$
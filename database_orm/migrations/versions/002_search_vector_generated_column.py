@@ -0,0 +1,218 @@
+"""Replace search_vector trigger with a generated column
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+The analyses_search_vector_update() PL/pgSQL trigger ran on every INSERT or
+UPDATE of raw_response, doing a dozen JSONB lookups and string
+concatenations per row in interpreted code. This migration replaces it with
+a STORED generated column computed by the executor:
+
+- summary and category are read from the analyses columns of the same
+  name (written alongside raw_response), so they are not decoded from JSONB
+- headline uses #>> with coalesce so a missing key contributes nothing
+- Array fields use jsonb_to_tsvector(..., '["string"]'), which is IMMUTABLE
+  (generated columns cannot contain the ARRAY(SELECT ...) subqueries the
+  trigger used) and accepts either a string or an array of strings
+- extracted_text may be a string or an array; jsonb_to_tsvector covers both
+- Each field is tagged with setweight() (A: headline/summary, B: category,
+  subcategories, key_interest, C: image details, D: location tags and
+  hashtags) so search can rank with ts_rank_cd
+
+Requires PostgreSQL 12+ (generated columns).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _weighted(expression: str, weight: str) -> str:
+    """setweight() wrapper for a tsvector expression."""
+    return f"setweight({expression}, '{weight}')"
+
+
+def _text(path: str) -> str:
+    """tsvector of a scalar JSONB text field (empty if missing)."""
+    return f"to_tsvector('english', coalesce(raw_response #>> '{path}', ''))"
+
+
+def _column(name: str) -> str:
+    """tsvector of a plain text column (empty if NULL)."""
+    return f"to_tsvector('english', coalesce({name}, ''))"
+
+
+def _jsonb_strings(path: str) -> str:
+    """tsvector of every string under a JSONB path (empty if missing)."""
+    return f"jsonb_to_tsvector('english', coalesce(raw_response #> '{path}', '[]'::jsonb), '[\"string\"]')"
+
+
+# Field weights for ts_rank_cd: A = headline/summary, B = category and
+# key_interest, C = descriptive detail, D = social metadata
+SEARCH_VECTOR_EXPRESSION = " || ".join([
+    _weighted(_text("{headline}"), "A"),
+    _weighted(_column("summary"), "A"),
+    _weighted(_column("category"), "B"),
+    _weighted(_jsonb_strings("{subcategories}"), "B"),
+    _weighted(_jsonb_strings("{image_details,key_interest}"), "B"),
+    _weighted(_jsonb_strings("{image_details,extracted_text}"), "C"),
+    _weighted(_jsonb_strings("{image_details,themes}"), "C"),
+    _weighted(_jsonb_strings("{image_details,objects}"), "C"),
+    _weighted(_jsonb_strings("{image_details,emotions}"), "C"),
+    _weighted(_jsonb_strings("{image_details,vibes}"), "C"),
+    _weighted(_jsonb_strings("{media_metadata,location_tags}"), "D"),
+    _weighted(_jsonb_strings("{media_metadata,hashtags}"), "D"),
+])
+
+
+def upgrade() -> None:
+    """
+    Drop the trigger/function and recreate search_vector as a generated column.
+    """
+    op.execute('DROP TRIGGER IF EXISTS analyses_search_vector_trigger ON analyses')
+    op.execute('DROP FUNCTION IF EXISTS analyses_search_vector_update()')
+
+    # Generated columns can't be added to an existing plain column; recreate it
+    op.drop_index('idx_analyses_search_vector', table_name='analyses')
+    op.drop_column('analyses', 'search_vector')
+    op.execute(f"""
+        ALTER TABLE analyses
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED
+    """)
+    op.create_index('idx_analyses_search_vector', 'analyses', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """
+    Restore the plain search_vector column and the PL/pgSQL trigger from 001.
+    """
+    op.drop_index('idx_analyses_search_vector', table_name='analyses')
+    op.drop_column('analyses', 'search_vector')
+    op.execute('ALTER TABLE analyses ADD COLUMN search_vector tsvector')
+    op.create_index('idx_analyses_search_vector', 'analyses', ['search_vector'], postgresql_using='gin')
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION analyses_search_vector_update() RETURNS trigger AS $$
+        DECLARE
+            search_text TEXT;
+            image_details JSONB;
+            media_metadata JSONB;
+        BEGIN
+            -- Extract fields from raw_response JSONB
+            search_text := '';
+
+            -- Add summary
+            IF NEW.raw_response->>'summary' IS NOT NULL THEN
+                search_text := search_text || ' ' || NEW.raw_response->>'summary';
+            END IF;
+
+            -- Add headline
+            IF NEW.raw_response->>'headline' IS NOT NULL THEN
+                search_text := search_text || ' ' || NEW.raw_response->>'headline';
+            END IF;
+
+            -- Add category
+            IF NEW.raw_response->>'category' IS NOT NULL THEN
+                search_text := search_text || ' ' || NEW.raw_response->>'category';
+            END IF;
+
+            -- Add subcategories (array)
+            IF NEW.raw_response->'subcategories' IS NOT NULL THEN
+                search_text := search_text || ' ' || array_to_string(
+                    ARRAY(SELECT jsonb_array_elements_text(NEW.raw_response->'subcategories')),
+                    ' '
+                );
+            END IF;
+
+            -- Extract image_details
+            image_details := NEW.raw_response->'image_details';
+            IF image_details IS NOT NULL THEN
+                -- Add extracted_text (can be string or array)
+                IF jsonb_typeof(image_details->'extracted_text') = 'array' THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(image_details->'extracted_text')),
+                        ' '
+                    );
+                ELSIF image_details->>'extracted_text' IS NOT NULL THEN
+                    search_text := search_text || ' ' || image_details->>'extracted_text';
+                END IF;
+
+                -- Add other image_details fields
+                IF image_details->>'key_interest' IS NOT NULL THEN
+                    search_text := search_text || ' ' || image_details->>'key_interest';
+                END IF;
+
+                IF image_details->'themes' IS NOT NULL THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(image_details->'themes')),
+                        ' '
+                    );
+                END IF;
+
+                IF image_details->'objects' IS NOT NULL THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(image_details->'objects')),
+                        ' '
+                    );
+                END IF;
+
+                IF image_details->'emotions' IS NOT NULL THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(image_details->'emotions')),
+                        ' '
+                    );
+                END IF;
+
+                IF image_details->'vibes' IS NOT NULL THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(image_details->'vibes')),
+                        ' '
+                    );
+                END IF;
+            END IF;
+
+            -- Extract media_metadata
+            media_metadata := NEW.raw_response->'media_metadata';
+            IF media_metadata IS NOT NULL THEN
+                IF media_metadata->'location_tags' IS NOT NULL THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(media_metadata->'location_tags')),
+                        ' '
+                    );
+                END IF;
+
+                IF media_metadata->'hashtags' IS NOT NULL THEN
+                    search_text := search_text || ' ' || array_to_string(
+                        ARRAY(SELECT jsonb_array_elements_text(media_metadata->'hashtags')),
+                        ' '
+                    );
+                END IF;
+            END IF;
+
+            -- Update search_vector using PostgreSQL's to_tsvector
+            NEW.search_vector := to_tsvector('english', search_text);
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Create trigger to automatically update search_vector
+    op.execute("""
+        CREATE TRIGGER analyses_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF raw_response ON analyses
+        FOR EACH ROW
+        EXECUTE FUNCTION analyses_search_vector_update();
+    """)
+
+    # Backfill existing rows through the restored trigger
+    op.execute('UPDATE analyses SET raw_response = raw_response')
@@ -0,0 +1,85 @@
+"""HNSW cosine index on langchain_pg_embedding
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+Vector search runs against langchain_pg_embedding (managed by
+langchain-postgres), not the legacy embeddings table from 001. This
+migration:
+
+- Fixes the embedding column to vector(1024) so it can be indexed
+  (langchain-postgres creates an untyped vector column by default)
+- Builds an HNSW index with vector_cosine_ops (m=16, ef_construction=64),
+  which needs no training pass and, unlike IVFFlat, does not degrade as
+  rows are added after the index is built
+
+langchain_pg_embedding is shared by every collection, so typing the column
+means ALL stored embeddings (prod, golden and any other collection) must be
+1024-dimensional. The upgrade checks this first and fails with the
+offending dimensions instead of a bare cast error; re-embed or delete those
+collections before retrying.
+
+Query-time recall is tuned with hnsw.ef_search, set per connection by
+PGVectorStoreManager. The table is created lazily by langchain-postgres, so
+both steps are skipped when it does not exist yet.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_DIMENSIONS = 1024
+
+
+def upgrade() -> None:
+    """
+    Type the embedding column and create the HNSW index.
+    """
+    op.execute(f"""
+        DO $$
+        DECLARE
+            other_dims text;
+        BEGIN
+            IF to_regclass('langchain_pg_embedding') IS NOT NULL THEN
+                -- The column is shared by all collections; refuse mixed dimensions
+                SELECT string_agg(DISTINCT vector_dims(embedding)::text, ', ')
+                    INTO other_dims
+                    FROM langchain_pg_embedding
+                    WHERE vector_dims(embedding) <> {EMBEDDING_DIMENSIONS};
+                IF other_dims IS NOT NULL THEN
+                    RAISE EXCEPTION 'langchain_pg_embedding has % -dimensional embeddings; vector({EMBEDDING_DIMENSIONS}) applies to every collection, so re-embed or delete them first', other_dims;
+                END IF;
+                ALTER TABLE langchain_pg_embedding
+                    ALTER COLUMN embedding TYPE vector({EMBEDDING_DIMENSIONS});
+                CREATE INDEX IF NOT EXISTS idx_langchain_embedding_hnsw
+                    ON langchain_pg_embedding
+                    USING hnsw (embedding vector_cosine_ops)
+                    WITH (m = 16, ef_construction = 64);
+            END IF;
+        END
+        $$;
+    """)
+
+
+def downgrade() -> None:
+    """
+    Drop the HNSW index and restore the untyped embedding column.
+    """
+    op.execute('DROP INDEX IF EXISTS idx_langchain_embedding_hnsw')
+    op.execute("""
+        DO $$
+        BEGIN
+            IF to_regclass('langchain_pg_embedding') IS NOT NULL THEN
+                ALTER TABLE langchain_pg_embedding ALTER COLUMN embedding TYPE vector;
+            END IF;
+        END
+        $$;
+    """)
@@ -0,0 +1,51 @@
+"""Composite indexes for list_items / count_items
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+list_items and count_items filter by user_id plus an optional category and
+page by created_at, but 001 only created single-column indexes, so Postgres
+had to bitmap-AND them or filter heap rows. This migration adds:
+
+- idx_analyses_user_cat_created: (user_id, category, created_at DESC)
+  INCLUDE (item_id), so the category filter is an index-only range scan
+- idx_items_user_created: (user_id, created_at DESC), so unfiltered pages
+  are read in order without a sort
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create composite indexes for the list/count filter path.
+    """
+    op.create_index(
+        'idx_analyses_user_cat_created',
+        'analyses',
+        ['user_id', 'category', sa.text('created_at DESC')],
+        postgresql_include=['item_id']
+    )
+    op.create_index(
+        'idx_items_user_created',
+        'items',
+        ['user_id', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the composite indexes.
+    """
+    op.drop_index('idx_items_user_created', table_name='items')
+    op.drop_index('idx_analyses_user_cat_created', table_name='analyses')
@@ -0,0 +1,47 @@
+"""Trigram indexes for fuzzy summary/headline search
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+The tsvector index only matches whole lexemes, so partial words and typos
+fall through to a sequential scan. This migration enables pg_trgm and adds
+GIN trigram indexes used by search_items_fuzzy:
+
+- idx_analyses_summary_trgm on analyses.summary
+- idx_analyses_headline_trgm on (raw_response->>'headline')
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Enable pg_trgm and create trigram GIN indexes.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX idx_analyses_summary_trgm ON analyses '
+        'USING gin (summary gin_trgm_ops)'
+    )
+    op.execute(
+        "CREATE INDEX idx_analyses_headline_trgm ON analyses "
+        "USING gin ((raw_response->>'headline') gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the trigram indexes (the extension is left installed).
+    """
+    op.execute('DROP INDEX IF EXISTS idx_analyses_headline_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_analyses_summary_trgm')
@@ -0,0 +1,48 @@
+"""Per-user GIN index for full-text search
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+search_items always filters by user_id, but idx_analyses_search_vector
+indexes every tenant's lexemes together, so each query walks posting lists
+for all users and filters afterwards. This migration replaces it with a
+multi-column GIN index on (user_id, search_vector) via btree_gin, so a
+single index scan intersects the tenant and the query terms.
+
+This gives per-tenant locality without hash-partitioning analyses, which
+would require widening the primary key to (id, user_id).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Replace the search_vector GIN index with a (user_id, search_vector) one.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gin')
+    op.create_index(
+        'idx_analyses_user_search_vector',
+        'analyses',
+        ['user_id', 'search_vector'],
+        postgresql_using='gin'
+    )
+    op.drop_index('idx_analyses_search_vector', table_name='analyses')
+
+
+def downgrade() -> None:
+    """
+    Restore the single-column search_vector GIN index.
+    """
+    op.create_index('idx_analyses_search_vector', 'analyses', ['search_vector'], postgresql_using='gin')
+    op.drop_index('idx_analyses_user_search_vector', table_name='analyses')
@@ -0,0 +1,41 @@
+"""BRIN index on analyses.created_at
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+analyses is append-only, so created_at follows physical row order. A BRIN
+index stores one min/max summary per block range, making time-range scans
+("analyses from the last 24h") cheap with negligible size and ingest cost.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create BRIN index on analyses.created_at.
+    """
+    op.create_index(
+        'idx_analyses_created_brin',
+        'analyses',
+        ['created_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop BRIN index.
+    """
+    op.drop_index('idx_analyses_created_brin', table_name='analyses')
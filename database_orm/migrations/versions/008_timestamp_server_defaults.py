@@ -0,0 +1,43 @@
+"""Server-side defaults for created_at / updated_at
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+Timestamps were filled in by Python lambdas on every insert. The models now
+use server_default=func.now(), so the columns need a database default; the
+ORM fetches the value back through INSERT ... RETURNING.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ('items', 'created_at'),
+    ('items', 'updated_at'),
+    ('analyses', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """
+    Default timestamp columns to now().
+    """
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """
+    Remove timestamp column defaults.
+    """
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
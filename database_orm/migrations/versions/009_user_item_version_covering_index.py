@@ -0,0 +1,64 @@
+"""Covering index for latest-analysis-per-item lookups
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+Every latest-version query filters by user_id and item_id and sorts by
+version DESC (get_latest_analysis, get_latest_analyses_bulk, the
+search_items max-version subquery, create_analysis version assignment).
+idx_analyses_item_version lacked user_id, so each match needed a heap
+fetch to check the tenant. This migration replaces it with
+(user_id, item_id, version DESC) INCLUDE (id), which serves the version
+subqueries as index-only scans.
+
+Both indexes are built/dropped CONCURRENTLY to avoid blocking writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Replace idx_analyses_item_version with a user-scoped covering index.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_analyses_user_item_version',
+            'analyses',
+            ['user_id', 'item_id', sa.text('version DESC')],
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_analyses_item_version',
+            table_name='analyses',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """
+    Restore idx_analyses_item_version.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_analyses_item_version',
+            'analyses',
+            ['item_id', sa.text('version DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_analyses_user_item_version',
+            table_name='analyses',
+            postgresql_concurrently=True
+        )
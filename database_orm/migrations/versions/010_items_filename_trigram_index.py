@@ -0,0 +1,45 @@
+"""Trigram index for filename substring search
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+A leading-wildcard ILIKE '%...%' on items.filename cannot use a btree
+index, so search_items_by_filename would scan every item. This migration
+adds a GIN trigram index (pg_trgm, enabled in 005) that serves both
+substring and prefix matches:
+
+- idx_items_filename_trgm on items.filename
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create the filename trigram GIN index.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_items_filename_trgm',
+        'items',
+        ['filename'],
+        postgresql_using='gin',
+        postgresql_ops={'filename': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the filename trigram index (the extension is left installed).
+    """
+    op.drop_index('idx_items_filename_trgm', table_name='items')
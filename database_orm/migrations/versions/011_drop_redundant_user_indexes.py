@@ -0,0 +1,64 @@
+"""Drop single-column user_id indexes covered by composites
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17
+
+ix_analyses_user_id is a strict prefix of idx_analyses_user_item_version
+and idx_analyses_user_cat_created, and ix_items_user_id of
+idx_items_user_created, so the planner never needs them for lookups while
+every INSERT still pays to maintain them. This migration drops both.
+
+ix_analyses_item_id is kept: the ON DELETE CASCADE from items and the
+Item.latest_analysis loader look analyses up by item_id alone, which no
+composite leads with.
+
+Indexes are dropped/built CONCURRENTLY to avoid blocking writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Drop the redundant user_id indexes.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_analyses_user_id',
+            table_name='analyses',
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_items_user_id',
+            table_name='items',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """
+    Restore the single-column user_id indexes.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_items_user_id',
+            'items',
+            ['user_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_analyses_user_id',
+            'analyses',
+            ['user_id'],
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,61 @@
+"""Keyset pagination index on items
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17
+
+list_items now orders by (created_at DESC, id DESC) and pages with a
+keyset predicate (created_at, id) < (anchor_created_at, anchor_id) instead
+of a deep OFFSET. This migration replaces idx_items_user_created with
+idx_items_user_created_id (user_id, created_at DESC, id DESC), so both the
+tie-broken sort and the keyset range are read straight from the index.
+
+Indexes are built/dropped CONCURRENTLY to avoid blocking writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Replace idx_items_user_created with a (created_at, id) keyset index.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_items_user_created_id',
+            'items',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_items_user_created',
+            table_name='items',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """
+    Restore idx_items_user_created.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_items_user_created',
+            'items',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_items_user_created_id',
+            table_name='items',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,64 @@
+"""Unique analysis versions per item
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-17
+
+create_analysis and bulk_create_analyses assign version = max + 1 inside
+the INSERT. Two concurrent writers for the same item could still both read
+the same max and insert duplicate versions. This migration rebuilds
+idx_analyses_user_item_version as a UNIQUE index (same columns, same
+INCLUDE), so the losing writer fails with an IntegrityError instead of
+silently duplicating a version. No extra index is maintained.
+
+The new index is built CONCURRENTLY under a temporary name, the old one is
+dropped and the new one renamed. Fails if duplicate versions already exist;
+resolve those first.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild(unique: bool) -> None:
+    """Swap idx_analyses_user_item_version for a (non-)unique rebuild."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_analyses_user_item_version_new',
+            'analyses',
+            ['user_id', 'item_id', sa.text('version DESC')],
+            unique=unique,
+            postgresql_include=['id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_analyses_user_item_version',
+            table_name='analyses',
+            postgresql_concurrently=True
+        )
+    op.execute(
+        'ALTER INDEX idx_analyses_user_item_version_new '
+        'RENAME TO idx_analyses_user_item_version'
+    )
+
+
+def upgrade() -> None:
+    """
+    Make idx_analyses_user_item_version unique.
+    """
+    _rebuild(unique=True)
+
+
+def downgrade() -> None:
+    """
+    Restore the non-unique idx_analyses_user_item_version.
+    """
+    _rebuild(unique=False)
@@ -15,7 +15,7 @@ EMBEDDING ARCHITECTURE:
 - See retrieval/postgres_bm25.py for BM25 search on the same table
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     Column,
@@ -26,9 +26,12 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Text,
+    and_,
+    func,
+    select,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import DeclarativeBase, relationship, Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import DeclarativeBase, relationship, Mapped, mapped_column, aliased, deferred
 from sqlalchemy.types import TypeDecorator, JSON
 
 # NOTE: pgvector is not imported here because embeddings are stored in
@@ -40,16 +43,35 @@ class JSONBType(TypeDecorator):
     """
     Custom JSONB type that works with both PostgreSQL and SQLite.
 
-    Uses JSONB for PostgreSQL and JSON for other databases.
+    Uses JSONB for PostgreSQL and JSON for other databases. Python None is
+    stored as SQL NULL rather than the JSON 'null' literal, so it costs no
+    serialization and stays IS NULL-queryable.
     """
     impl = JSON
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
-            return dialect.type_descriptor(JSONB())
+            return dialect.type_descriptor(JSONB(none_as_null=True))
         else:
-            return dialect.type_descriptor(JSON())
+            return dialect.type_descriptor(JSON(none_as_null=True))
+
+
+class TSVectorType(TypeDecorator):
+    """
+    TSVECTOR on PostgreSQL, Text elsewhere (SQLite tests).
+
+    Gives search_vector its real type so @@ / ts_rank_cd expressions and
+    the GIN index are typed against tsvector rather than text.
+    """
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(TSVECTOR())
+        else:
+            return dialect.type_descriptor(Text())
 
 
 # NOTE: VectorType was removed because embeddings are now stored in
@@ -73,8 +95,8 @@ class Item(Base):
     # Primary key
     id: Mapped[str] = mapped_column(String, primary_key=True)
 
-    # User association for multi-tenancy
-    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # User association for multi-tenancy (indexed via idx_items_user_created_id)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
 
     # File metadata
     filename: Mapped[str] = mapped_column(String, nullable=False)
@@ -83,24 +105,29 @@ class Item(Base):
     file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     mime_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    # Timestamps
+    # Timestamps (database clock; fetched back via INSERT ... RETURNING)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc)
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc)
+        server_default=func.now(),
+        onupdate=func.now()
     )
 
     # Relationships
+    # lazy="raise": load explicitly with selectinload(Item.analyses) so no
+    # access path silently issues a SELECT per item. passive_deletes leaves
+    # child rows to the ON DELETE CASCADE foreign key instead of loading them.
     analyses: Mapped[list["Analysis"]] = relationship(
         "Analysis",
         back_populates="item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True
     )
     # NOTE: Embeddings are stored in langchain_pg_embedding table (not ORM)
     # See retrieval/pgvector_store.py for embedding management
@@ -131,8 +158,9 @@ class Analysis(Base):
         index=True
     )
 
-    # User association for multi-tenancy (denormalized for faster queries)
-    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # User association for multi-tenancy (denormalized for faster queries;
+    # indexed as the leading column of the composite indexes below)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
 
     # Versioning
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
@@ -147,14 +175,17 @@ class Analysis(Base):
     model_used: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     trace_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    # Full-text search column (populated by trigger in PostgreSQL, unused in SQLite)
-    search_vector = Column(Text, nullable=True)  # Will be TSVECTOR in PostgreSQL via migration
+    # Full-text search column: a STORED generated TSVECTOR in PostgreSQL (migration 002),
+    # so it is never written by the ORM. Unused in SQLite. Deferred so entity
+    # loads and INSERT ... RETURNING don't ship the tsvector back; it is only
+    # referenced in search predicates.
+    search_vector = deferred(Column(TSVectorType, nullable=True))
 
-    # Timestamp
+    # Timestamp (database clock)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc)
+        server_default=func.now()
     )
 
     # Relationships
@@ -166,6 +197,26 @@ class Analysis(Base):
         return f"<Analysis(id={self.id}, item_id={self.item_id}, version={self.version})>"
 
 
+# Latest analysis per item (highest version), read-only. Load with
+# selectinload(Item.latest_analysis) so a page of items costs one extra query
+# instead of one per item.
+_NewerAnalysis = aliased(Analysis)
+Item.latest_analysis = relationship(
+    Analysis,
+    primaryjoin=and_(
+        Item.id == Analysis.item_id,
+        Analysis.version == (
+            select(func.max(_NewerAnalysis.version))
+            .where(_NewerAnalysis.item_id == Analysis.item_id)
+            .correlate_except(_NewerAnalysis)
+            .scalar_subquery()
+        ),
+    ),
+    uselist=False,
+    viewonly=True,
+)
+
+
 # EMBEDDING ARCHITECTURE NOTE:
 # ----------------------------
 # Embeddings are NOT stored in an ORM model. They are stored in the
@@ -192,17 +243,59 @@ class Analysis(Base):
 
 # Indexes for performance optimization
 
-# Index for user_id on items (already created via index=True in column definition)
-# Index for user_id on analyses (already created via index=True in column definition)
+# user_id on items/analyses has no single-column index: it leads
+# idx_items_user_created_id and the analyses composites (migration 011)
 
 # Index for item_id on analyses (already created via index=True in column definition)
 # Index for category on analyses (already created via index=True in column definition)
 
-# Composite index for item_id + version on analyses for efficient latest version queries
-Index("idx_analyses_item_version", Analysis.item_id, Analysis.version.desc())
+# Covering index for latest-version queries, which always filter by user_id and
+# item_id (migration 009); INCLUDE (id) keeps the version subqueries index-only.
+# Unique (migration 013) so concurrent writers can't both claim version max + 1
+Index(
+    "idx_analyses_user_item_version",
+    Analysis.user_id,
+    Analysis.item_id,
+    Analysis.version.desc(),
+    unique=True,
+    postgresql_include=["id"]
+)
+
+# Composite indexes for the list_items/count_items filter path (migrations 004
+# and 012): category filters become an index-only range scan, and unfiltered
+# pages (including keyset pages) read items in (created_at, id) order without a sort
+Index(
+    "idx_analyses_user_cat_created",
+    Analysis.user_id,
+    Analysis.category,
+    Analysis.created_at.desc(),
+    postgresql_include=["item_id"]
+)
+Index("idx_items_user_created_id", Item.user_id, Item.created_at.desc(), Item.id.desc())
+
+# Trigram GIN index for filename substring/prefix search (migration 010)
+Index(
+    "idx_items_filename_trgm",
+    Item.filename,
+    postgresql_using="gin",
+    postgresql_ops={"filename": "gin_trgm_ops"}
+)
 
-# GIN index for full-text search on search_vector
-Index("idx_analyses_search_vector", Analysis.search_vector, postgresql_using="gin")
+# BRIN index for time-range scans on the append-only analyses table (migration 007)
+Index(
+    "idx_analyses_created_brin",
+    Analysis.created_at,
+    postgresql_using="brin",
+    postgresql_with={"pages_per_range": 32}
+)
+
+# GIN index for full-text search, scoped per user (btree_gin, migration 006)
+Index(
+    "idx_analyses_user_search_vector",
+    Analysis.user_id,
+    Analysis.search_vector,
+    postgresql_using="gin"
+)
 
 # NOTE: Vector search indexes are managed by langchain-postgres in the
 # langchain_pg_embedding table. See retrieval/pgvector_store.py for details.
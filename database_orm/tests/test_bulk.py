@@ -0,0 +1,143 @@
+"""
+Unit tests for bulk loading helpers.
+
+COPY itself needs PostgreSQL; these tests cover the CSV serialization and
+the executemany fallback on SQLite.
+"""
+
+import csv
+from datetime import datetime, timezone
+
+import pytest
+from unittest.mock import MagicMock
+from sqlalchemy import create_engine, inspect, select
+from sqlalchemy.orm import sessionmaker
+
+from database_orm.bulk import (
+    bulk_insert,
+    copy_buffer,
+    drop_secondary_indexes,
+    initial_load,
+    recreate_secondary_indexes,
+)
+from database_orm.models import Base, Item, Analysis
+
+
+@pytest.fixture
+def session():
+    """Create in-memory SQLite session for testing."""
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+class TestCopyBuffer:
+    """Test CSV serialization for COPY."""
+
+    def test_serializes_nulls_json_and_datetimes(self):
+        created = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        rows = [{
+            "id": "a",
+            "summary": None,
+            "raw_response": {"text": 'quote " and, comma'},
+            "created_at": created,
+        }]
+
+        buffer = copy_buffer(rows, ["id", "summary", "raw_response", "created_at"])
+        fields = next(csv.reader(buffer))
+
+        assert fields == ["a", r"\N", '{"text":"quote \\" and, comma"}', created.isoformat()]
+
+    def test_empty_string_is_not_null(self):
+        buffer = copy_buffer([{"id": "a", "summary": ""}], ["id", "summary"])
+
+        assert buffer.getvalue() == "a,\n"
+
+
+class TestBulkInsert:
+    """Test bulk_insert fallback path."""
+
+    def test_inserts_rows(self, session):
+        rows = [
+            {"id": f"item-{i}", "user_id": "user-1", "filename": f"{i}.jpg", "file_path": f"/{i}.jpg"}
+            for i in range(3)
+        ]
+
+        assert bulk_insert(session, Item, rows) == 3
+        session.commit()
+
+        assert session.scalars(select(Item.id).order_by(Item.id)).all() == ["item-0", "item-1", "item-2"]
+
+    def test_empty_rows(self, session):
+        assert bulk_insert(session, Item, []) == 0
+
+
+class TestCopyDrivers:
+    """Test COPY is fed through the API of the connection's driver."""
+
+    ROWS = [
+        {"id": f"item-{i}", "user_id": "user-1", "filename": f"{i}.jpg", "file_path": f"/{i}.jpg"}
+        for i in range(3)
+    ]
+
+    def _session(self, driver, cursor):
+        session = MagicMock()
+        connection = session.connection.return_value
+        connection.dialect.name = "postgresql"
+        connection.dialect.driver = driver
+        connection.connection.cursor.return_value = cursor
+        return session
+
+    def test_psycopg2_uses_copy_expert(self, monkeypatch):
+        monkeypatch.setattr("database_orm.bulk.COPY_THRESHOLD", 1)
+        cursor = MagicMock(spec=["copy_expert", "close", "rowcount"])
+
+        assert bulk_insert(self._session("psycopg2", cursor), Item, self.ROWS) == 3
+
+        sql, buffer = cursor.copy_expert.call_args.args
+        assert sql.startswith("COPY items (id, user_id, filename, file_path)")
+        assert buffer.getvalue().count("\n") == 3
+
+    def test_psycopg3_uses_copy_writer(self, monkeypatch):
+        monkeypatch.setattr("database_orm.bulk.COPY_THRESHOLD", 1)
+        # psycopg 3 cursors have copy() but no copy_expert
+        cursor = MagicMock(spec=["copy", "close", "rowcount"])
+
+        assert bulk_insert(self._session("psycopg", cursor), Item, self.ROWS) == 3
+
+        assert cursor.copy.call_args.args[0].startswith("COPY items (")
+        writer = cursor.copy.return_value.__enter__.return_value
+        written = "".join(call.args[0] for call in writer.write.call_args_list)
+        assert written.splitlines()[0] == "item-0,user-1,0.jpg,/0.jpg"
+
+
+class TestSecondaryIndexes:
+    """Test dropping and rebuilding metadata indexes around a load."""
+
+    def test_drop_and_recreate(self, session):
+        connection = session.connection()
+        before = {i["name"] for i in inspect(connection).get_indexes("analyses")}
+
+        dropped = drop_secondary_indexes(connection, Analysis)
+        assert inspect(connection).get_indexes("analyses") == []
+
+        recreate_secondary_indexes(connection, dropped)
+        after = {i["name"] for i in inspect(connection).get_indexes("analyses")}
+
+        assert before and after == before
+
+    def test_initial_load_requires_postgresql(self, session):
+        with pytest.raises(ValueError):
+            initial_load(session.get_bind(), [(Item, "items.csv")])
+
+    def test_initial_load_lifts_statement_timeout(self):
+        engine = MagicMock()
+        engine.dialect.name = "postgresql"
+        connection = engine.begin.return_value.__enter__.return_value
+
+        assert initial_load(engine, []) == {}
+
+        first = connection.execute.call_args_list[0].args[0]
+        assert str(first) == "SET LOCAL statement_timeout = 0"
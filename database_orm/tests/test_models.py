@@ -12,9 +12,9 @@ EMBEDDING ARCHITECTURE NOTE:
 
 import pytest
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import sessionmaker, selectinload
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
 
 from database_orm.models import Base, Item, Analysis
 
@@ -23,6 +23,12 @@ from database_orm.models import Base, Item, Analysis
 def engine():
     """Create in-memory SQLite engine for testing."""
     engine = create_engine("sqlite:///:memory:", echo=False)
+
+    # Item.analyses relies on ON DELETE CASCADE (passive_deletes)
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_conn, connection_record):
+        dbapi_conn.execute("PRAGMA foreign_keys=ON")
+
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
@@ -55,7 +61,7 @@ class TestItemModel:
         session.commit()
 
         # Verify item was created
-        retrieved = session.query(Item).filter_by(id="test-item-1").first()
+        retrieved = session.scalars(select(Item).filter_by(id="test-item-1")).first()
         assert retrieved is not None
         assert retrieved.user_id == "user-123"
         assert retrieved.filename == "test.jpg"
@@ -113,9 +119,19 @@ class TestItemModel:
         session.add(analysis)
         session.commit()
 
+        # Lazy loading is disabled; the collection must be loaded explicitly
+        with pytest.raises(InvalidRequestError):
+            item.analyses
+
         # Verify relationship
-        assert len(item.analyses) == 1
-        assert item.analyses[0].id == "analysis-1"
+        loaded = session.execute(
+            select(Item)
+            .options(selectinload(Item.analyses))
+            .where(Item.id == "test-item-4")
+            .execution_options(populate_existing=True)
+        ).scalar_one()
+        assert len(loaded.analyses) == 1
+        assert loaded.analyses[0].id == "analysis-1"
 
 
 class TestAnalysisModel:
@@ -153,7 +169,7 @@ class TestAnalysisModel:
         session.commit()
 
         # Verify analysis was created
-        retrieved = session.query(Analysis).filter_by(id="analysis-2").first()
+        retrieved = session.scalars(select(Analysis).filter_by(id="analysis-2")).first()
         assert retrieved is not None
         assert retrieved.category == "photo"
         assert retrieved.raw_response["tags"] == ["nature", "landscape"]
@@ -184,10 +200,33 @@ class TestAnalysisModel:
         session.commit()
 
         # Verify nested structure preserved
-        retrieved = session.query(Analysis).filter_by(id="analysis-3").first()
+        retrieved = session.scalars(select(Analysis).filter_by(id="analysis-3")).first()
         assert retrieved.raw_response["nested"]["data"] == "value"
         assert retrieved.raw_response["nested"]["array"] == [1, 2, 3]
 
+    def test_analysis_jsonb_none_is_sql_null(self, session):
+        """Test that raw_response=None is stored as SQL NULL, not JSON 'null'."""
+        session.add(Item(
+            id="test-item-9",
+            user_id="user-123",
+            filename="test9.jpg",
+            file_path="/data/test9.jpg"
+        ))
+        session.add(Analysis(
+            id="analysis-9",
+            item_id="test-item-9",
+            user_id="user-123",
+            version=1,
+            raw_response=None
+        ))
+        session.commit()
+
+        assert session.scalars(select(Analysis.id).where(Analysis.raw_response.is_(None))).all() == ["analysis-9"]
+
+    def test_search_vector_not_loaded_with_entity(self):
+        """Test the generated tsvector is deferred from entity loads."""
+        assert "search_vector" not in str(select(Analysis))
+
     def test_analysis_versioning(self, session):
         """Test analysis version tracking."""
         item = Item(
@@ -198,25 +237,41 @@ class TestAnalysisModel:
         )
         session.add(item)
 
-        # Create multiple versions
-        for version in [1, 2, 3]:
-            analysis = Analysis(
-                id=f"analysis-v{version}",
-                item_id="test-item-7",
-                user_id="user-123",
-                version=version,
-                category="photo",
-                raw_response={"version": version}
-            )
-            session.add(analysis)
-
+        # Create multiple versions in one executemany INSERT
+        session.execute(insert(Analysis), [
+            {
+                "id": f"analysis-v{version}",
+                "item_id": "test-item-7",
+                "user_id": "user-123",
+                "version": version,
+                "category": "photo",
+                "raw_response": {"version": version}
+            }
+            for version in [1, 2, 3]
+        ])
         session.commit()
 
         # Verify all versions exist
-        analyses = session.query(Analysis).filter_by(item_id="test-item-7").all()
+        analyses = session.scalars(select(Analysis).filter_by(item_id="test-item-7")).all()
         assert len(analyses) == 3
         assert {a.version for a in analyses} == {1, 2, 3}
 
+    def test_analysis_version_unique_per_item(self, session):
+        """Test the same version can't be stored twice for one item."""
+        session.add(Item(
+            id="test-item-10",
+            user_id="user-123",
+            filename="test10.jpg",
+            file_path="/data/test10.jpg"
+        ))
+        session.commit()
+
+        with pytest.raises(IntegrityError):
+            session.execute(insert(Analysis), [
+                {"id": f"analysis-dup-{n}", "item_id": "test-item-10", "user_id": "user-123", "version": 1}
+                for n in range(2)
+            ])
+
     def test_analysis_cascade_delete(self, session):
         """Test cascade delete from item to analysis."""
         item = Item(
@@ -242,7 +297,7 @@ class TestAnalysisModel:
         session.commit()
 
         # Verify analysis was also deleted
-        retrieved = session.query(Analysis).filter_by(id="analysis-4").first()
+        retrieved = session.scalars(select(Analysis).filter_by(id="analysis-4")).first()
         assert retrieved is None
 
     def test_analysis_relationship_to_item(self, session):
@@ -12,22 +12,132 @@ Key changes from SQLite version:
 - Full-text search via PostgreSQL tsvector
 """
 
+import os
 import json
 import uuid
 import logging
+import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import attrgetter
 from datetime import datetime, timezone
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterator
 
-from sqlalchemy import select, func, delete, or_, text
-from sqlalchemy.orm import Session, joinedload
+from cachetools import TTLCache
+from sqlalchemy import (
+    select, func, delete, insert, literal, literal_column, or_, text, tuple_, lambda_stmt
+)
+from sqlalchemy.orm import Session, aliased, selectinload
 
+from database_orm import bulk
 from database_orm.models import Item, Analysis
 # Note: Embedding model removed - embeddings now handled by langchain-postgres
-from database_orm.connection import get_session, init_connection
+from database_orm.connection import get_session, read_only_session, init_connection, is_postgres
 
 logger = logging.getLogger(__name__)
 
+# Max bind parameters per IN (...) clause; stays under SQLITE_MAX_VARIABLE_NUMBER
+_IN_CLAUSE_CHUNK_SIZE = 900
+
+# Opt-in read-through cache for get_item / get_latest_analysis.
+# DB_ITEM_TTL (seconds) bounds staleness across Lambda instances; 0 disables.
+_READ_CACHE_TTL = int(os.getenv("DB_ITEM_TTL", "0"))
+_READ_CACHE_MAXSIZE = int(os.getenv("DB_ITEM_CACHE_SIZE", "4096"))
+_item_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=_READ_CACHE_MAXSIZE, ttl=_READ_CACHE_TTL) if _READ_CACHE_TTL > 0 else None
+)
+_latest_analysis_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=_READ_CACHE_MAXSIZE, ttl=_READ_CACHE_TTL) if _READ_CACHE_TTL > 0 else None
+)
+_cache_lock = threading.Lock()  # TTLCache is not thread-safe
+
+# Per-request identity map for single-row reads, active inside request_scope().
+# Keyed by (kind, id, user_id); always on, since it never outlives a request.
+_request_cache: ContextVar[Optional[dict]] = ContextVar("_request_cache", default=None)
+
+# Rows fetched per round trip when streaming large result sets
+_FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", "200"))
+
+# Column-row projections for reads and RETURNING that only build dicts: plain Rows
+# skip ORM instance construction, and analyses leave out the search_vector
+# tsvector, which no caller reads
+_ITEM_COLUMNS = tuple(Item.__table__.c)
+_ANALYSIS_COLUMNS = tuple(c for c in Analysis.__table__.c if c.name != "search_vector")
+
+
+@contextmanager
+def request_scope() -> Generator[None, None, None]:
+    """
+    Coalesce repeated get_item / get_analysis / get_latest_analysis calls.
+
+    Within the block, each row is fetched from the database at most once;
+    writes through this module invalidate the affected entries. Wired from
+    HTTP middleware so each request gets its own map.
+    """
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def _cache_get(cache: Optional[TTLCache], kind: str, key: tuple) -> Optional[dict]:
+    """
+    Return a copy of a cached row dict, or None on miss/disabled cache.
+
+    Checks the request-scoped map first, then the opt-in TTL cache.
+    """
+    scoped = _request_cache.get()
+    value = scoped.get((kind, *key)) if scoped is not None else None
+    if value is None and cache is not None:
+        with _cache_lock:
+            value = cache.get(key)
+        if value is not None and scoped is not None:
+            scoped[(kind, *key)] = value
+    # Copy so callers can't mutate the cached entry
+    return dict(value) if value is not None else None
+
+
+def _cache_put(cache: Optional[TTLCache], kind: str, key: tuple, value: Optional[dict]) -> None:
+    """Store a row dict in the request map and TTL cache (misses are not cached)."""
+    if value is None:
+        return
+    scoped = _request_cache.get()
+    if scoped is not None:
+        scoped[(kind, *key)] = dict(value)
+    if cache is not None:
+        with _cache_lock:
+            cache[key] = dict(value)
+
+
+def _invalidate_item_cache(item_id: str, user_id: str) -> None:
+    """Drop cached reads for an item after it (or its analyses) change."""
+    key = (item_id, user_id)
+    scoped = _request_cache.get()
+    if scoped is not None:
+        scoped.pop(("item", *key), None)
+        scoped.pop(("latest_analysis", *key), None)
+        # Analyses cached by id go too (delete_item cascades to them)
+        for stale in [k for k, v in scoped.items() if k[0] == "analysis" and v["item_id"] == item_id]:
+            del scoped[stale]
+    with _cache_lock:
+        if _item_cache is not None:
+            _item_cache.pop(key, None)
+        if _latest_analysis_cache is not None:
+            _latest_analysis_cache.pop(key, None)
+
+
+def clear_read_cache() -> None:
+    """Clear all cached get_item / get_latest_analysis results."""
+    scoped = _request_cache.get()
+    if scoped is not None:
+        scoped.clear()
+    with _cache_lock:
+        if _item_cache is not None:
+            _item_cache.clear()
+        if _latest_analysis_cache is not None:
+            _latest_analysis_cache.clear()
+
 
 def init_db():
     """
@@ -53,6 +163,95 @@ def get_db() -> Generator[Session, None, None]:
         yield session
 
 
+@contextmanager
+def _session_scope(session: Optional[Session] = None) -> Generator[Session, None, None]:
+    """
+    Reuse a caller-owned session, or open a new one that commits on exit.
+
+    A caller-owned session is never committed here; the owner (for example
+    batch_write) decides when the transaction ends.
+    """
+    if session is not None:
+        yield session
+    else:
+        with get_session() as new_session:
+            yield new_session
+
+
+class BatchWriter:
+    """
+    Write helper bound to a single session/transaction.
+
+    Obtained from batch_write(); every create_* call shares the same session
+    and nothing is committed until the batch_write block exits.
+    """
+
+    def __init__(self, session: Session, user_id: str):
+        self.session = session
+        self.user_id = user_id
+
+    def create_item(self, item_id: str, filename: str, original_filename: str,
+                    file_path: str, file_size: int, mime_type: str) -> dict:
+        """Create an item in the batch transaction (see create_item)."""
+        return create_item(
+            item_id=item_id,
+            filename=filename,
+            original_filename=original_filename,
+            file_path=file_path,
+            file_size=file_size,
+            mime_type=mime_type,
+            user_id=self.user_id,
+            session=self.session
+        )
+
+    def bulk_create_items(self, rows: list[dict]) -> list[dict]:
+        """Create many items in the batch transaction (see bulk_create_items)."""
+        return bulk_create_items(rows, user_id=self.user_id, session=self.session)
+
+    def create_analysis(self, analysis_id: str, item_id: str, result: dict,
+                        provider_used: str, model_used: str,
+                        trace_id: Optional[str] = None) -> dict:
+        """Create an analysis in the batch transaction (see create_analysis)."""
+        return create_analysis(
+            analysis_id=analysis_id,
+            item_id=item_id,
+            user_id=self.user_id,
+            result=result,
+            provider_used=provider_used,
+            model_used=model_used,
+            trace_id=trace_id,
+            session=self.session
+        )
+
+    def bulk_create_analyses(self, rows: list[dict]) -> list[dict]:
+        """Create many analyses in the batch transaction (see bulk_create_analyses)."""
+        return bulk_create_analyses(rows, user_id=self.user_id, session=self.session)
+
+
+@contextmanager
+def batch_write(user_id: str) -> Generator[BatchWriter, None, None]:
+    """
+    Group several writes into one session and a single commit.
+
+    Embeddings are not part of the batch: they are written to
+    langchain_pg_embedding by PGVectorStoreManager after the commit.
+
+    Args:
+        user_id: User identifier applied to every write in the batch
+
+    Yields:
+        BatchWriter bound to the shared session
+
+    Example:
+        >>> with batch_write(user_id) as batch:
+        ...     batch.create_item(item_id, filename, ...)
+        ...     batch.create_analysis(analysis_id, item_id, result, ...)
+        ...     # committed once on exit, rolled back on error
+    """
+    with get_session() as session:
+        yield BatchWriter(session, user_id)
+
+
 def create_item(
     item_id: str,
     filename: str,
@@ -60,7 +259,8 @@ def create_item(
     file_path: str,
     file_size: int,
     mime_type: str,
-    user_id: str
+    user_id: str,
+    session: Optional[Session] = None
 ) -> dict:
     """
     Create a new item in the database.
@@ -73,25 +273,76 @@ def create_item(
         file_size: Size in bytes
         mime_type: MIME type
         user_id: User identifier (required for multi-tenancy)
+        session: Optional session to reuse (caller owns the commit)
 
     Returns:
         Dictionary representation of created item
     """
-    with get_session() as session:
-        item = Item(
-            id=item_id,
-            user_id=user_id,
-            filename=filename,
-            original_filename=original_filename,
-            file_path=file_path,
-            file_size=file_size,
-            mime_type=mime_type
-        )
-        session.add(item)
-        session.commit()
-        session.refresh(item)
+    return bulk_create_items(
+        [{
+            "item_id": item_id,
+            "filename": filename,
+            "original_filename": original_filename,
+            "file_path": file_path,
+            "file_size": file_size,
+            "mime_type": mime_type,
+        }],
+        user_id=user_id,
+        session=session
+    )[0]
+
+
+def bulk_create_items(
+    rows: list[dict],
+    user_id: str,
+    session: Optional[Session] = None
+) -> list[dict]:
+    """
+    Create many items with one batched INSERT.
 
-        return _item_to_dict(item)
+    On PostgreSQL, batches of bulk.COPY_THRESHOLD rows or more are loaded
+    with COPY; smaller ones (and other dialects) use a single executemany
+    INSERT ... RETURNING, which also hands back the server timestamps.
+
+    Args:
+        rows: Dicts with item_id, filename, original_filename, file_path,
+            file_size and mime_type
+        user_id: User identifier applied to every row
+        session: Optional session to reuse (caller owns the commit)
+
+    Returns:
+        Dictionary representations of the created items, in input order
+    """
+    if not rows:
+        return []
+
+    values = [
+        {
+            "id": row["item_id"],
+            "user_id": user_id,
+            "filename": row["filename"],
+            "original_filename": row.get("original_filename"),
+            "file_path": row["file_path"],
+            "file_size": row.get("file_size"),
+            "mime_type": row.get("mime_type"),
+        }
+        for row in rows
+    ]
+
+    with _session_scope(session) as session:
+        if is_postgres() and len(values) >= bulk.COPY_THRESHOLD:
+            # COPY returns nothing; now() is fixed per transaction, so this
+            # equals the column defaults
+            now = session.scalar(select(func.now()))
+            for value in values:
+                value["created_at"] = value["updated_at"] = now
+            bulk.bulk_insert(session, Item, values)
+            # The dicts are already in _item_to_dict's shape; no ORM objects
+            created_at = _isoformat(now)
+            return [{**value, "created_at": created_at, "updated_at": created_at} for value in values]
+
+        stmt = insert(Item).returning(Item, sort_by_parameter_order=True)
+        return [_item_to_dict(item) for item in session.scalars(stmt, values)]
 
 
 def get_item(item_id: str, user_id: str) -> Optional[dict]:
@@ -105,45 +356,182 @@ def get_item(item_id: str, user_id: str) -> Optional[dict]:
     Returns:
         Dictionary representation of item or None
     """
-    with get_session() as session:
-        stmt = select(Item).filter_by(id=item_id, user_id=user_id)
+    cached = _cache_get(_item_cache, "item", (item_id, user_id))
+    if cached is not None:
+        return cached
+
+    with read_only_session() as session:
+        # lambda_stmt caches the compiled SQL by code location; ids become binds
+        stmt = lambda_stmt(lambda: select(Item).filter_by(id=item_id, user_id=user_id))
         item = session.scalar(stmt)
-        return _item_to_dict(item) if item else None
+        result = _item_to_dict(item) if item else None
+
+    _cache_put(_item_cache, "item", (item_id, user_id), result)
+    return result
+
+
+def _has_category(user_id: str, category: str):
+    """
+    EXISTS semi-join: the item has an analysis in this category.
+
+    Stops at the first matching analysis per item, with no DISTINCT over
+    duplicated join rows. The redundant Analysis.user_id predicate lets
+    idx_analyses_user_cat_created serve the probe as an index-only scan.
+    """
+    return (
+        select(Analysis.id)
+        .where(
+            Analysis.item_id == Item.id,
+            Analysis.user_id == user_id,
+            Analysis.category == category
+        )
+        .exists()
+    )
+
+
+def _list_items_stmt(
+    user_id: str,
+    category: Optional[str] = None,
+    rows: bool = False,
+    after_id: Optional[str] = None
+):
+    """
+    Base SELECT for list_items / iter_items, newest first.
+
+    With rows=True, selects the items columns instead of the Item entity:
+    plain Rows skip ORM instance construction and identity-map bookkeeping,
+    and _item_to_dict reads them by attribute just like an Item.
+
+    With after_id, returns only items that sort after that item (keyset
+    pagination): (created_at, id) < the anchor's, which is a range scan on
+    idx_items_user_created_id however deep the page is. The anchor's
+    created_at is read in SQL so the comparison is column-to-column on
+    every dialect.
+    """
+    stmt = select(*_ITEM_COLUMNS) if rows else select(Item)
+    stmt = stmt.where(Item.user_id == user_id)
+
+    if after_id:
+        anchor = aliased(Item)
+        anchor_created_at = (
+            select(anchor.created_at)
+            .where(anchor.id == after_id, anchor.user_id == user_id)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(
+            tuple_(Item.created_at, Item.id) < tuple_(anchor_created_at, literal(after_id))
+        )
+
+    if category:
+        stmt = stmt.where(_has_category(user_id, category))
+
+    # id breaks created_at ties so keyset pages never skip or repeat rows
+    return stmt.order_by(Item.created_at.desc(), Item.id.desc())
 
 
 def list_items(
     user_id: str,
     category: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    after_id: Optional[str] = None
 ) -> list[dict]:
     """
     List items with optional category filter.
 
+    Prefer after_id (the last id of the previous page) over offset for
+    deep pages: OFFSET still reads and discards every skipped row.
+
     Args:
         user_id: User identifier
         category: Optional category filter
         limit: Maximum number of items
         offset: Offset for pagination
+        after_id: Keyset cursor; return items after this item. If the
+            anchor item no longer exists the page is empty.
 
     Returns:
         List of item dictionaries
     """
-    with get_session() as session:
-        stmt = select(Item).filter_by(user_id=user_id)
+    with read_only_session() as session:
+        stmt = (
+            _list_items_stmt(user_id, category, rows=True, after_id=after_id)
+            .limit(limit)
+            .offset(offset)
+        )
+        items = session.execute(stmt).all()
 
-        if category:
-            # Join with analyses to filter by category
-            stmt = (
-                stmt.join(Analysis, Item.id == Analysis.item_id)
-                .filter(Analysis.category == category)
-                .distinct()
-            )
+        return [_item_to_dict(item) for item in items]
+
+
+def list_items_with_latest_analysis(
+    user_id: str,
+    category: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    after_id: Optional[str] = None
+) -> list[dict]:
+    """
+    List items with their latest analysis eagerly loaded.
+
+    Issues two queries regardless of page size (items, then one
+    selectinload for Item.latest_analysis) instead of one
+    get_latest_analysis call per item.
+
+    Args:
+        user_id: User identifier
+        category: Optional category filter
+        limit: Maximum number of items
+        offset: Offset for pagination
+        after_id: Keyset cursor (see list_items)
 
-        stmt = stmt.order_by(Item.created_at.desc()).limit(limit).offset(offset)
+    Returns:
+        List of item dictionaries, each with a "latest_analysis" key
+        (analysis dictionary or None)
+    """
+    with read_only_session() as session:
+        stmt = (
+            _list_items_stmt(user_id, category, after_id=after_id)
+            .options(selectinload(Item.latest_analysis))
+            .limit(limit)
+            .offset(offset)
+        )
         items = session.scalars(stmt).all()
 
-        return [_item_to_dict(item) for item in items]
+        return [
+            {**_item_to_dict(item), "latest_analysis": _analysis_to_dict(item.latest_analysis)}
+            for item in items
+        ]
+
+
+def iter_items(
+    user_id: str,
+    category: Optional[str] = None,
+    chunk_size: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Stream all items with optional category filter.
+
+    Uses a server-side cursor on PostgreSQL (yield_per implies
+    stream_results), so memory stays constant regardless of result size.
+    Intended for backfills and full scans; use list_items for pages.
+
+    Args:
+        user_id: User identifier
+        category: Optional category filter
+        chunk_size: Rows fetched per round trip (default: DB_FETCH_SIZE)
+
+    Yields:
+        Item dictionaries ordered by created_at (newest first)
+    """
+    # Server-side cursors need a transaction
+    with read_only_session(autocommit=False) as session:
+        stmt = _list_items_stmt(user_id, category, rows=True).execution_options(
+            yield_per=chunk_size or _FETCH_SIZE
+        )
+
+        for item in session.execute(stmt):
+            yield _item_to_dict(item)
 
 
 def count_items(user_id: str, category: Optional[str] = None) -> int:
@@ -157,15 +545,17 @@ def count_items(user_id: str, category: Optional[str] = None) -> int:
     Returns:
         Count of items
     """
-    with get_session() as session:
+    with read_only_session() as session:
+        # lambda_stmt: the SELECT is built and compiled once per branch
         if category:
-            stmt = (
-                select(func.count(func.distinct(Item.id)))
-                .join(Analysis, Item.id == Analysis.item_id)
-                .filter(Item.user_id == user_id, Analysis.category == category)
+            stmt = lambda_stmt(
+                lambda: select(func.count(Item.id)).filter(
+                    Item.user_id == user_id,
+                    _has_category(user_id, category)
+                )
             )
         else:
-            stmt = select(func.count(Item.id)).filter_by(user_id=user_id)
+            stmt = lambda_stmt(lambda: select(func.count(Item.id)).filter_by(user_id=user_id))
 
         return session.scalar(stmt) or 0
 
@@ -181,11 +571,38 @@ def delete_item(item_id: str, user_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
+    return bool(delete_items([item_id], user_id=user_id))
+
+
+def delete_items(item_ids: list[str], user_id: str) -> list[str]:
+    """
+    Delete many items in one statement per chunk (cascades to analyses).
+
+    Args:
+        item_ids: Item identifiers
+        user_id: User identifier (for security)
+
+    Returns:
+        IDs that were actually deleted (missing or foreign ids are skipped)
+    """
+    if not item_ids:
+        return []
+
+    deleted = []
     with get_session() as session:
-        stmt = delete(Item).filter_by(id=item_id, user_id=user_id)
-        result = session.execute(stmt)
-        session.commit()
-        return result.rowcount > 0
+        for chunk in _chunked(list(dict.fromkeys(item_ids)), _IN_CLAUSE_CHUNK_SIZE):
+            # Core DELETE ... RETURNING; no ORM objects to synchronize
+            stmt = (
+                delete(Item)
+                .where(Item.id.in_(chunk), Item.user_id == user_id)
+                .returning(Item.id)
+                .execution_options(synchronize_session=False)
+            )
+            deleted.extend(session.scalars(stmt).all())
+
+    for item_id in deleted:
+        _invalidate_item_cache(item_id, user_id)
+    return deleted
 
 
 def create_analysis(
@@ -195,7 +612,8 @@ def create_analysis(
     result: dict,
     provider_used: str,
     model_used: str,
-    trace_id: Optional[str] = None
+    trace_id: Optional[str] = None,
+    session: Optional[Session] = None
 ) -> dict:
     """
     Create a new analysis for an item.
@@ -208,37 +626,121 @@ def create_analysis(
         provider_used: AI provider name
         model_used: Model name
         trace_id: Optional tracing identifier
+        session: Optional session to reuse (caller owns the commit)
 
     Returns:
         Dictionary representation of created analysis
+
+    Raises:
+        IntegrityError: If a concurrent write claimed the same version
+            (idx_analyses_user_item_version is unique); safe to retry
     """
-    with get_session() as session:
-        # Get next version number
+    with _session_scope(session) as session:
+        # Next version is computed inside the INSERT and the row comes back
+        # via RETURNING: one round trip instead of SELECT max + INSERT
+        next_version = (
+            select(func.coalesce(func.max(Analysis.version), 0) + 1)
+            .where(Analysis.item_id == item_id, Analysis.user_id == user_id)
+            .scalar_subquery()
+        )
         stmt = (
-            select(func.max(Analysis.version))
-            .filter_by(item_id=item_id, user_id=user_id)
+            insert(Analysis)
+            .values(
+                id=analysis_id,
+                item_id=item_id,
+                user_id=user_id,
+                version=next_version,
+                category=result.get("category"),
+                summary=result.get("summary"),
+                raw_response=result,
+                provider_used=provider_used,
+                model_used=model_used,
+                trace_id=trace_id
+            )
+            .returning(*_ANALYSIS_COLUMNS)
         )
-        max_version = session.scalar(stmt) or 0
-        version = max_version + 1
+        analysis = session.execute(stmt).one()
 
-        analysis = Analysis(
-            id=analysis_id,
-            item_id=item_id,
-            user_id=user_id,
-            version=version,
-            category=result.get("category"),
-            summary=result.get("summary"),
-            raw_response=result,
-            provider_used=provider_used,
-            model_used=model_used,
-            trace_id=trace_id
-        )
+    _invalidate_item_cache(item_id, user_id)
+    return _analysis_to_dict(analysis)
+
+
+def bulk_create_analyses(
+    rows: list[dict],
+    user_id: str,
+    session: Optional[Session] = None
+) -> list[dict]:
+    """
+    Create many analyses with one version lookup and one batched INSERT.
+
+    Versions are assigned as in create_analysis (max existing + 1 per item,
+    incrementing for repeated item_ids within rows). On PostgreSQL, batches
+    of bulk.COPY_THRESHOLD rows or more are loaded with COPY; smaller ones
+    (and other dialects) use a single executemany INSERT ... RETURNING.
+
+    Args:
+        rows: Dicts with analysis_id, item_id, result, provider_used,
+            model_used and optional trace_id
+        user_id: User identifier applied to every row
+        session: Optional session to reuse (caller owns the commit)
+
+    Returns:
+        Dictionary representations of the created analyses, in input order
+    """
+    if not rows:
+        return []
 
-        session.add(analysis)
-        session.commit()
-        session.refresh(analysis)
+    item_ids = list(dict.fromkeys(row["item_id"] for row in rows))
 
-        return _analysis_to_dict(analysis)
+    with _session_scope(session) as session:
+        versions = {}
+        for chunk in _chunked(item_ids, _IN_CLAUSE_CHUNK_SIZE):
+            stmt = (
+                select(Analysis.item_id, func.max(Analysis.version))
+                .filter(Analysis.item_id.in_(chunk), Analysis.user_id == user_id)
+                .group_by(Analysis.item_id)
+            )
+            versions.update(session.execute(stmt).all())
+
+        values = []
+        for row in rows:
+            item_id = row["item_id"]
+            versions[item_id] = (versions.get(item_id) or 0) + 1
+            result = row["result"]
+            values.append({
+                "id": row["analysis_id"],
+                "item_id": item_id,
+                "user_id": user_id,
+                "version": versions[item_id],
+                "category": result.get("category"),
+                "summary": result.get("summary"),
+                "raw_response": result,
+                "provider_used": row["provider_used"],
+                "model_used": row["model_used"],
+                "trace_id": row.get("trace_id"),
+            })
+
+        if is_postgres() and len(values) >= bulk.COPY_THRESHOLD:
+            # COPY returns nothing, so stamp created_at up front; now() is
+            # fixed per transaction, so this equals the column default
+            created_at = session.scalar(select(func.now()))
+            for value in values:
+                value["created_at"] = created_at
+            bulk.bulk_insert(session, Analysis, values)
+            # The dicts are already in _analysis_to_dict's shape; no ORM objects
+            stamp = _isoformat(created_at)
+            analyses = [
+                {**value, "raw_response": value["raw_response"] or {}, "created_at": stamp}
+                for value in values
+            ]
+        else:
+            # RETURNING hands back server-generated created_at in the same statement
+            stmt = insert(Analysis).returning(*_ANALYSIS_COLUMNS, sort_by_parameter_order=True)
+            analyses = [_analysis_to_dict(row) for row in session.execute(stmt, values)]
+
+    for item_id in item_ids:
+        _invalidate_item_cache(item_id, user_id)
+    return analyses
 
 
 def get_analysis(analysis_id: str, user_id: str) -> Optional[dict]:
@@ -252,10 +754,17 @@ def get_analysis(analysis_id: str, user_id: str) -> Optional[dict]:
     Returns:
         Dictionary representation of analysis or None
     """
-    with get_session() as session:
-        stmt = select(Analysis).filter_by(id=analysis_id, user_id=user_id)
+    cached = _cache_get(None, "analysis", (analysis_id, user_id))
+    if cached is not None:
+        return cached
+
+    with read_only_session() as session:
+        stmt = lambda_stmt(lambda: select(Analysis).filter_by(id=analysis_id, user_id=user_id))
         analysis = session.scalar(stmt)
-        return _analysis_to_dict(analysis) if analysis else None
+        result = _analysis_to_dict(analysis) if analysis else None
+
+    _cache_put(None, "analysis", (analysis_id, user_id), result)
+    return result
 
 
 def get_latest_analysis(item_id: str, user_id: str) -> Optional[dict]:
@@ -269,15 +778,22 @@ def get_latest_analysis(item_id: str, user_id: str) -> Optional[dict]:
     Returns:
         Dictionary representation of latest analysis or None
     """
-    with get_session() as session:
-        stmt = (
-            select(Analysis)
+    cached = _cache_get(_latest_analysis_cache, "latest_analysis", (item_id, user_id))
+    if cached is not None:
+        return cached
+
+    with read_only_session() as session:
+        stmt = lambda_stmt(
+            lambda: select(Analysis)
             .filter_by(item_id=item_id, user_id=user_id)
             .order_by(Analysis.version.desc())
             .limit(1)
         )
         analysis = session.scalar(stmt)
-        return _analysis_to_dict(analysis) if analysis else None
+        result = _analysis_to_dict(analysis) if analysis else None
+
+    _cache_put(_latest_analysis_cache, "latest_analysis", (item_id, user_id), result)
+    return result
 
 
 def get_item_analyses(item_id: str, user_id: str) -> list[dict]:
@@ -291,22 +807,55 @@ def get_item_analyses(item_id: str, user_id: str) -> list[dict]:
     Returns:
         List of analysis dictionaries ordered by version (newest first)
     """
-    with get_session() as session:
-        stmt = (
-            select(Analysis)
+    with read_only_session() as session:
+        stmt = lambda_stmt(
+            lambda: select(*_ANALYSIS_COLUMNS)
             .filter_by(item_id=item_id, user_id=user_id)
             .order_by(Analysis.version.desc())
         )
-        analyses = session.scalars(stmt).all()
+        analyses = session.execute(stmt).all()
         return [_analysis_to_dict(a) for a in analyses]
 
 
+def iter_item_analyses(
+    item_id: str,
+    user_id: str,
+    chunk_size: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Stream all analyses for an item, newest version first.
+
+    Server-side cursor counterpart of get_item_analyses (see iter_items) for
+    export/reporting callers: memory stays at one chunk of rows.
+
+    Args:
+        item_id: Item identifier
+        user_id: User identifier
+        chunk_size: Rows fetched per round trip (default: DB_FETCH_SIZE)
+
+    Yields:
+        Analysis dictionaries ordered by version (newest first)
+    """
+    # Server-side cursors need a transaction
+    with read_only_session(autocommit=False) as session:
+        stmt = (
+            select(*_ANALYSIS_COLUMNS)
+            .filter_by(item_id=item_id, user_id=user_id)
+            .order_by(Analysis.version.desc())
+            .execution_options(yield_per=chunk_size or _FETCH_SIZE)
+        )
+
+        for analysis in session.execute(stmt):
+            yield _analysis_to_dict(analysis)
+
+
 def batch_get_items_with_analyses(
     item_ids: list[str],
     user_id: str
 ) -> dict[str, dict]:
     """
-    Fetch multiple items with their latest analyses in a single optimized query.
+    Fetch multiple items with their latest analyses in two queries:
+    the items, then their latest analyses via selectinload.
 
     Args:
         item_ids: List of item IDs to fetch
@@ -318,31 +867,124 @@ def batch_get_items_with_analyses(
     if not item_ids:
         return {}
 
-    with get_session() as session:
-        # Load items with their analyses eagerly
+    with read_only_session() as session:
+        # Two queries: the items, then only their latest analyses (one
+        # version per item, not every version joined onto the item rows)
         stmt = (
             select(Item)
             .filter(Item.id.in_(item_ids), Item.user_id == user_id)
-            .options(joinedload(Item.analyses))
+            .options(selectinload(Item.latest_analysis))
         )
-        items = session.scalars(stmt).unique().all()
+        items = session.scalars(stmt).all()
 
         results = {}
         for item in items:
             item_dict = _item_to_dict(item)
-
-            # Get latest analysis
-            if item.analyses:
-                latest = max(item.analyses, key=lambda a: a.version)
-                item_dict['analysis'] = _analysis_to_dict(latest)
-            else:
-                item_dict['analysis'] = None
-
+            item_dict['analysis'] = _analysis_to_dict(item.latest_analysis)
             results[item.id] = item_dict
 
         return results
 
 
+def _chunked(values: list[str], size: int) -> Iterator[list[str]]:
+    """Yield successive slices of values no larger than size."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def get_items_bulk(item_ids: list[str], user_id: str) -> dict[str, dict]:
+    """
+    Get multiple items by ID in a single round trip per chunk.
+
+    Args:
+        item_ids: Item identifiers
+        user_id: User identifier (for security)
+
+    Returns:
+        Dict mapping item_id -> item dictionary, in the order of item_ids.
+        IDs that are not found are omitted.
+    """
+    if not item_ids:
+        return {}
+
+    unique_ids = list(dict.fromkeys(item_ids))
+    found = {}
+
+    with read_only_session() as session:
+        for chunk in _chunked(unique_ids, _IN_CLAUSE_CHUNK_SIZE):
+            stmt = select(*_ITEM_COLUMNS).filter(Item.id.in_(chunk), Item.user_id == user_id)
+            for item in session.execute(stmt):
+                found[item.id] = _item_to_dict(item)
+
+    return {item_id: found[item_id] for item_id in unique_ids if item_id in found}
+
+
+def get_latest_analyses_bulk(item_ids: list[str], user_id: str) -> dict[str, dict]:
+    """
+    Get the latest analysis for multiple items in a single round trip per chunk.
+
+    Uses ROW_NUMBER() OVER (PARTITION BY item_id ORDER BY version DESC) so only
+    the newest version of each item's analysis is returned by the database.
+
+    Args:
+        item_ids: Item identifiers
+        user_id: User identifier
+
+    Returns:
+        Dict mapping item_id -> latest analysis dictionary, in the order of
+        item_ids. Items without an analysis are omitted.
+    """
+    if not item_ids:
+        return {}
+
+    unique_ids = list(dict.fromkeys(item_ids))
+    found = {}
+
+    with read_only_session() as session:
+        for chunk in _chunked(unique_ids, _IN_CLAUSE_CHUNK_SIZE):
+            ranked = (
+                select(
+                    Analysis.id,
+                    func.row_number().over(
+                        partition_by=Analysis.item_id,
+                        order_by=Analysis.version.desc()
+                    ).label('rn')
+                )
+                .filter(Analysis.item_id.in_(chunk), Analysis.user_id == user_id)
+                .subquery()
+            )
+            stmt = (
+                select(*_ANALYSIS_COLUMNS)
+                .join(ranked, Analysis.id == ranked.c.id)
+                .filter(ranked.c.rn == 1)
+            )
+            for analysis in session.execute(stmt):
+                found[analysis.item_id] = _analysis_to_dict(analysis)
+
+    return {item_id: found[item_id] for item_id in unique_ids if item_id in found}
+
+
+def _is_latest_version(user_id: str):
+    """
+    Predicate keeping only the newest Analysis version per item.
+
+    A correlated NOT EXISTS: each candidate row probes
+    idx_analyses_user_item_version for a newer version (index-only), so a
+    search touches only its matches instead of aggregating max(version)
+    over all of the user's analyses and joining back.
+    """
+    newer = aliased(Analysis)
+    return ~(
+        select(newer.id)
+        .where(
+            newer.user_id == user_id,
+            newer.item_id == Analysis.item_id,
+            newer.version > Analysis.version
+        )
+        .exists()
+    )
+
+
 def search_items(
     query: str,
     user_id: str,
@@ -354,7 +996,7 @@ def search_items(
     Search items using PostgreSQL full-text search.
 
     Args:
-        query: Search query string
+        query: Search query in web-search syntax ("quoted phrase", or, -term)
         user_id: User identifier
         top_k: Maximum number of results
         category_filter: Optional category filter
@@ -363,88 +1005,177 @@ def search_items(
     Returns:
         List of (item_id, score) tuples ordered by relevance
     """
-    with get_session() as session:
-        # Create tsquery from search query
-        tsquery = func.plainto_tsquery('english', query)
-
-        # Build query with ts_rank for scoring
-        stmt = (
-            select(
+    with read_only_session() as session:
+        # Built with lambda_stmt: the statement is constructed and compiled
+        # once per shape (with/without category); query, user_id and top_k
+        # are extracted as bind parameters on every call.
+        # Rank by cover density over the weighted (A-D) search_vector;
+        # normalization 32 maps the score into 0-1 as rank / (rank + 1).
+        # Only the latest analysis per item is considered.
+        stmt = lambda_stmt(
+            lambda: select(
                 Analysis.item_id,
-                func.ts_rank(Analysis.search_vector, tsquery).label('score')
+                func.ts_rank_cd(
+                    Analysis.search_vector, func.websearch_to_tsquery('english', query), 32
+                ).label('score')
             )
             .filter(
                 Analysis.user_id == user_id,
-                Analysis.search_vector.op('@@')(tsquery)
+                Analysis.search_vector.op('@@')(func.websearch_to_tsquery('english', query)),
+                _is_latest_version(user_id)
             )
         )
 
         if category_filter:
-            stmt = stmt.filter(Analysis.category == category_filter)
+            stmt += lambda s: s.filter(Analysis.category == category_filter)
+
+        if min_relevance_score > 0:
+            # Rows below the threshold are never ranked past LIMIT or sent back
+            stmt += lambda s: s.filter(
+                func.ts_rank_cd(
+                    Analysis.search_vector, func.websearch_to_tsquery('english', query), 32
+                ) >= min_relevance_score
+            )
 
-        # Get only latest analysis per item
-        subq = (
-            select(
-                Analysis.item_id,
-                func.max(Analysis.version).label('max_version')
+        stmt += lambda s: s.order_by(text('score DESC')).limit(top_k)
+
+        return [(r.item_id, float(r.score)) for r in session.execute(stmt)]
+
+
+def search_items_fuzzy(
+    query: str,
+    user_id: str,
+    top_k: int = 10,
+    category_filter: Optional[str] = None,
+    min_similarity: float = 0.3
+) -> list[tuple[str, float]]:
+    """
+    Substring/typo-tolerant search over summary and headline (PostgreSQL only).
+
+    Fallback for queries the tsvector path misses (partial words, typos).
+    Uses pg_trgm word_similarity; the <% operator is served by the trigram
+    GIN indexes from migration 005 instead of a sequential scan. <% compares
+    against pg_trgm.word_similarity_threshold, which is set to
+    min_similarity for the query's transaction so the cutoff is applied
+    before LIMIT.
+
+    Args:
+        query: Search query string
+        user_id: User identifier
+        top_k: Maximum number of results
+        category_filter: Optional category filter
+        min_similarity: Minimum word_similarity (0.0-1.0)
+
+    Returns:
+        List of (item_id, score) tuples ordered by similarity
+    """
+    # Literal key so the expression matches idx_analyses_headline_trgm
+    headline = Analysis.raw_response.op('->>')(literal_column("'headline'"))
+
+    # A transaction is needed so the threshold stays local to this query
+    with read_only_session(autocommit=False) as session:
+        # set_config(..., true) is SET LOCAL with a bindable value
+        session.execute(
+            select(func.set_config('pg_trgm.word_similarity_threshold', str(min_similarity), True))
+        )
+
+        score = func.greatest(
+            func.coalesce(func.word_similarity(query, Analysis.summary), 0),
+            func.coalesce(func.word_similarity(query, headline), 0)
+        ).label('score')
+
+        stmt = select(Analysis.item_id, score).filter(
+            Analysis.user_id == user_id,
+            or_(
+                literal(query).op('<%')(Analysis.summary),
+                literal(query).op('<%')(headline)
             )
-            .filter(Analysis.user_id == user_id)
-            .group_by(Analysis.item_id)
-            .subquery()
         )
 
+        if category_filter:
+            stmt = stmt.filter(Analysis.category == category_filter)
+
+        # Only the latest analysis per item
         stmt = (
-            stmt.join(
-                subq,
-                (Analysis.item_id == subq.c.item_id) &
-                (Analysis.version == subq.c.max_version)
-            )
+            stmt.filter(_is_latest_version(user_id))
             .order_by(text('score DESC'))
             .limit(top_k)
         )
 
-        results = session.execute(stmt).all()
+        return [(r.item_id, float(r.score)) for r in session.execute(stmt)]
+
+
+def search_items_by_filename(
+    query: str,
+    user_id: str,
+    limit: int = 50
+) -> list[dict]:
+    """
+    Case-insensitive substring match on item filenames, newest first.
+
+    On PostgreSQL the ILIKE '%query%' predicate is served by the trigram
+    GIN index from migration 010 (idx_items_filename_trgm).
+
+    Args:
+        query: Substring to look for in the filename
+        user_id: User identifier
+        limit: Maximum number of items
+
+    Returns:
+        List of item dictionaries
+    """
+    # Escape LIKE wildcards so the query is matched literally
+    pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
-        # Filter by minimum score
-        filtered = [(r.item_id, float(r.score)) for r in results if r.score >= min_relevance_score]
+    with read_only_session() as session:
+        stmt = (
+            select(*_ITEM_COLUMNS)
+            .where(
+                Item.user_id == user_id,
+                Item.filename.ilike(f"%{pattern}%", escape="\\")
+            )
+            .order_by(Item.created_at.desc())
+            .limit(limit)
+        )
+        items = session.execute(stmt).all()
 
-        return filtered
+        return [_item_to_dict(item) for item in items]
 
 
 def rebuild_search_index() -> dict:
     """
     Rebuild search index (for PostgreSQL this is a no-op).
 
-    Search vectors are automatically maintained by triggers.
+    Search vectors are a generated column, maintained by PostgreSQL on write.
 
     Returns:
         Status dictionary
     """
-    with get_session() as session:
+    with read_only_session() as session:
         stmt = select(func.count(Analysis.id))
         count = session.scalar(stmt) or 0
 
         return {
             "num_documents": count,
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "message": "PostgreSQL search vectors are automatically maintained by triggers"
+            "message": "PostgreSQL search vectors are a generated column maintained on write"
         }
 
 
 def get_search_status() -> dict:
     """Get current search index status."""
-    with get_session() as session:
-        # Count analyses with search vectors
-        stmt = select(func.count(Analysis.id)).filter(Analysis.search_vector.isnot(None))
-        indexed_count = session.scalar(stmt) or 0
-
-        # Count total analyses
-        stmt = select(func.count(Analysis.id))
-        total_analyses = session.scalar(stmt) or 0
-
-        # Count total items
-        stmt = select(func.count(Item.id))
-        total_items = session.scalar(stmt) or 0
+    with read_only_session() as session:
+        # One round trip: both analyses counts come from a single scan
+        # (COUNT ... FILTER), items are counted in a scalar subquery
+        stmt = select(
+            func.count(Analysis.id).filter(Analysis.search_vector.isnot(None)),
+            func.count(Analysis.id),
+            select(func.count(Item.id)).scalar_subquery()
+        )
+        indexed_count, total_analyses, total_items = session.execute(stmt).one()
+        indexed_count = indexed_count or 0
+        total_analyses = total_analyses or 0
+        total_items = total_items or 0
 
         return {
             "doc_count": indexed_count,
@@ -464,42 +1195,43 @@ def get_search_status() -> dict:
 
 # Helper functions to convert ORM objects to dictionaries
 
-def _item_to_dict(item: Optional[Item]) -> Optional[dict]:
-    """Convert Item ORM object to dictionary."""
+# Field order matches the dict key order callers (and API responses) expect
+_ITEM_FIELDS = ("id", "user_id", "filename", "original_filename", "file_path", "file_size", "mime_type")
+_get_item_fields = attrgetter(*_ITEM_FIELDS)
+_get_item_timestamps = attrgetter("created_at", "updated_at")
+
+_ANALYSIS_FIELDS = ("id", "item_id", "user_id", "version", "category", "summary")
+_ANALYSIS_TRAILING_FIELDS = ("provider_used", "model_used", "trace_id")
+_get_analysis_fields = attrgetter(*_ANALYSIS_FIELDS)
+_get_analysis_trailing_fields = attrgetter(*_ANALYSIS_TRAILING_FIELDS)
+
+# Unbound C method: skips the per-row attribute lookup on each timestamp
+_isoformat = datetime.isoformat
+
+
+def _item_to_dict(item) -> Optional[dict]:
+    """Convert an Item ORM object (or a row of items columns) to dictionary."""
     if not item:
         return None
 
-    return {
-        "id": item.id,
-        "user_id": item.user_id,
-        "filename": item.filename,
-        "original_filename": item.original_filename,
-        "file_path": item.file_path,
-        "file_size": item.file_size,
-        "mime_type": item.mime_type,
-        "created_at": item.created_at.isoformat() if item.created_at else None,
-        "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-    }
-
-
-def _analysis_to_dict(analysis: Optional[Analysis]) -> Optional[dict]:
-    """Convert Analysis ORM object to dictionary."""
+    data = dict(zip(_ITEM_FIELDS, _get_item_fields(item)))
+    created_at, updated_at = _get_item_timestamps(item)
+    data["created_at"] = _isoformat(created_at) if created_at else None
+    data["updated_at"] = _isoformat(updated_at) if updated_at else None
+    return data
+
+
+def _analysis_to_dict(analysis) -> Optional[dict]:
+    """Convert an Analysis ORM object (or a row of analyses columns) to dictionary."""
     if not analysis:
         return None
 
-    return {
-        "id": analysis.id,
-        "item_id": analysis.item_id,
-        "user_id": analysis.user_id,
-        "version": analysis.version,
-        "category": analysis.category,
-        "summary": analysis.summary,
-        "raw_response": analysis.raw_response or {},
-        "provider_used": analysis.provider_used,
-        "model_used": analysis.model_used,
-        "trace_id": analysis.trace_id,
-        "created_at": analysis.created_at.isoformat() if analysis.created_at else None,
-    }
+    data = dict(zip(_ANALYSIS_FIELDS, _get_analysis_fields(analysis)))
+    data["raw_response"] = analysis.raw_response or {}
+    data.update(zip(_ANALYSIS_TRAILING_FIELDS, _get_analysis_trailing_fields(analysis)))
+    created_at = analysis.created_at
+    data["created_at"] = _isoformat(created_at) if created_at else None
+    return data
 
 
 # Note: _embedding_to_dict removed - embeddings now handled by langchain-postgres
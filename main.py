@@ -39,7 +39,8 @@ from database_sqlalchemy import (
     init_db,
     create_item,
     get_item,
-    list_items,
+    list_items_with_latest_analysis,
+    iter_items,
     count_items,
     delete_item,
     create_analysis,
@@ -47,6 +48,7 @@ from database_sqlalchemy import (
     get_latest_analysis,
     get_item_analyses,
     search_items,
+    request_scope,
 )
 
 from llm import analyze_image, get_trace_id, get_resolved_provider_and_model
@@ -180,6 +182,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def database_request_scope(request: Request, call_next):
+    """Fetch each item/analysis row at most once per request."""
+    with request_scope():
+        return await call_next(request)
+
+
 # Mount static files (only if directory exists - not needed in Lambda)
 if os.path.exists("static"):
     app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -248,7 +258,11 @@ def _item_to_response(item: dict, include_analysis: bool = True, user_id: Option
         if not user_id:
             user_id = item.get("user_id", "default")
 
-        analysis_data = get_latest_analysis(item["id"], user_id=user_id)
+        # Use the eagerly loaded analysis when the caller already fetched it
+        if "latest_analysis" in item:
+            analysis_data = item["latest_analysis"]
+        else:
+            analysis_data = get_latest_analysis(item["id"], user_id=user_id)
         if analysis_data:
             latest_analysis = AnalysisResponse(
                 id=analysis_data["id"],
@@ -382,18 +396,26 @@ async def list_items_endpoint(
     request: Request,
     category: str | None = Query(None),
     limit: int = Query(50, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None)
 ):
-    """List all items with optional filtering."""
+    """List all items with optional filtering.
+
+    Pass the previous response's next_cursor as cursor for keyset paging,
+    which stays fast at any depth (offset is kept for compatibility).
+    """
     # Extract user_id for multi-tenancy
     user_id = get_user_id_from_request(request)
 
-    items = list_items(category=category, limit=limit, offset=offset, user_id=user_id)
+    items = list_items_with_latest_analysis(
+        category=category, limit=limit, offset=offset, after_id=cursor, user_id=user_id
+    )
     total = count_items(category=category, user_id=user_id)
 
     return ItemListResponse(
         items=[_item_to_response(item, user_id=user_id) for item in items],
         total=total,
+        next_cursor=items[-1]["id"] if len(items) == limit else None,
     )
 
 
@@ -1105,9 +1127,8 @@ async def get_items_for_review(
     golden_data = load_golden_dataset()
     reviewed_ids = {entry["item_id"] for entry in golden_data.get("golden_analyses", [])}
 
-    # Get all items from PostgreSQL
-    all_items = list_items(limit=10000, offset=0, user_id=user_id)
-    all_item_ids = [item['id'] for item in all_items]
+    # Stream all items from PostgreSQL (server-side cursor, no 10k cap)
+    all_item_ids = [item['id'] for item in iter_items(user_id=user_id)]
 
     # Filter based on review_mode
     if review_mode == "unreviewed":
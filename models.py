@@ -57,6 +57,7 @@ class ItemListResponse(BaseModel):
     """Response model for listing items."""
     items: list[ItemResponse]
     total: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
 
 
 class SearchRequest(BaseModel):
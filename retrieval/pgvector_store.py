@@ -14,11 +14,20 @@ from langchain_postgres import PGVector
 from langchain_postgres.vectorstores import PGVector as PGVectorStore
 from langchain_voyageai import VoyageAIEmbeddings
 from langchain_core.documents import Document
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import bindparam, text
 
 from utils.document_builder import create_flat_document, create_langchain_document
 
 logger = logging.getLogger(__name__)
 
+# Collection document count in one roundtrip; built once so it is compiled once
+_COLLECTION_COUNT_STMT = text(
+    "SELECT COUNT(*) FROM langchain_pg_embedding e "
+    "JOIN langchain_pg_collection c ON e.collection_id = c.uuid "
+    "WHERE c.name = :name"
+)
+
 
 class PGVectorStoreManager:
     """PostgreSQL PGVector store manager with VoyageAI embeddings.
@@ -30,6 +39,7 @@ class PGVectorStoreManager:
     - Metadata filtering support (user_id isolation)
     - Connection string from AWS Parameter Store
     - Cosine distance for similarity matching
+    - HNSW index (migration 003) with per-connection hnsw.ef_search
     """
 
     def __init__(
@@ -38,7 +48,9 @@ class PGVectorStoreManager:
         collection_name: str = "collections_vectors",
         embedding_model: str = "voyage-3.5-lite",
         use_parameter_store: bool = True,
-        parameter_name: str = "/collections-local/rds/connection-string"
+        parameter_name: str = "/collections-local/rds/connection-string",
+        embedding_length: int = 1024,
+        ef_search: Optional[int] = None
     ):
         """Initialize PGVector store.
 
@@ -48,9 +60,15 @@ class PGVectorStoreManager:
             embedding_model: VoyageAI model name
             use_parameter_store: Whether to load connection string from Parameter Store
             parameter_name: AWS Parameter Store parameter name for connection string
+            embedding_length: Vector dimensions (types the embedding column so
+                the HNSW index from migration 003 applies)
+            ef_search: HNSW candidate list size per query (default: HNSW_EF_SEARCH
+                env or 40); higher trades latency for recall
         """
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        self.ef_search = ef_search or int(os.getenv("HNSW_EF_SEARCH", "40"))
+        self.pgbouncer = os.getenv("PGBOUNCER", "false").lower() in ("1", "true")
 
         # Get connection string
         if not connection_string:
@@ -76,14 +94,33 @@ class PGVectorStoreManager:
             collection_name=collection_name,
             connection=connection_string,
             distance_strategy="cosine",  # CRITICAL: Must match ChromaDB
-            use_jsonb=True  # Store metadata as JSONB for efficient filtering
+            use_jsonb=True,  # Store metadata as JSONB for efficient filtering
+            embedding_length=embedding_length,
+            engine_args=self._engine_args()
         )
 
         logger.info(
             f"Initialized PGVector store: {collection_name} "
-            f"(model={embedding_model}, distance=cosine)"
+            f"(model={embedding_model}, distance=cosine, ef_search={self.ef_search})"
         )
 
+    def _engine_args(self) -> Dict[str, Any]:
+        """SQLAlchemy engine options for the PGVector connection.
+
+        hnsw.ef_search is set as a startup option, except behind PgBouncer
+        (PGBOUNCER=1), which rejects startup options. There search_by_vector
+        applies it per transaction instead; LangChain's own similarity_search
+        paths fall back to the role/server setting.
+        """
+        if self.pgbouncer:
+            logger.warning(
+                "PGBOUNCER=1: hnsw.ef_search=%s is applied only by search_by_vector; "
+                "set it on the database role for similarity_search",
+                self.ef_search
+            )
+            return {}
+        return {"connect_args": {"options": f"-c hnsw.ef_search={self.ef_search}"}}
+
     def add_documents(
         self,
         documents: List[Document],
@@ -128,6 +165,56 @@ class PGVectorStoreManager:
         Returns:
             Document ID
         """
+        doc = self._build_document(item_id, raw_response, filename, user_id)
+
+        # Add to vector store
+        doc_ids = self.add_documents([doc], ids=[item_id])
+        return doc_ids[0] if doc_ids else item_id
+
+    def add_documents_bulk(
+        self,
+        records: List[Dict[str, Any]],
+        batch_size: int = 500
+    ) -> List[str]:
+        """Add many documents with one embedding call and one INSERT per batch.
+
+        Each record takes the same fields as add_document (item_id,
+        raw_response, filename, optional user_id). Compared with calling
+        add_document in a loop, this collapses N VoyageAI requests and N
+        INSERT round trips into one of each per batch.
+
+        Args:
+            records: List of dicts with item_id, raw_response, filename, user_id
+            batch_size: Maximum documents per embedding call / INSERT
+
+        Returns:
+            List of document IDs in input order
+        """
+        doc_ids: List[str] = []
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            docs = [
+                self._build_document(
+                    record["item_id"],
+                    record["raw_response"],
+                    record["filename"],
+                    record.get("user_id")
+                )
+                for record in batch
+            ]
+            doc_ids.extend(
+                self.add_documents(docs, ids=[record["item_id"] for record in batch])
+            )
+        return doc_ids
+
+    @staticmethod
+    def _build_document(
+        item_id: str,
+        raw_response: dict,
+        filename: str,
+        user_id: Optional[str] = None
+    ) -> Document:
+        """Build the LangChain Document stored for a single item."""
         # Create document using shared utility
         doc = create_langchain_document(
             raw_response=raw_response,
@@ -144,9 +231,7 @@ class PGVectorStoreManager:
         doc.metadata["headline"] = raw_response.get("headline", "")
         doc.metadata["summary"] = raw_response.get("summary", "")
 
-        # Add to vector store
-        doc_ids = self.add_documents([doc], ids=[item_id])
-        return doc_ids[0] if doc_ids else item_id
+        return doc
 
     def similarity_search(
         self,
@@ -201,6 +286,59 @@ class PGVectorStoreManager:
             logger.error(f"Similarity search with score failed: {e}")
             return []
 
+    def search_by_vector(
+        self,
+        query_vector: List[float],
+        k: int = 10,
+        user_id: Optional[str] = None
+    ) -> List[tuple[str, float]]:
+        """Nearest items to a precomputed embedding, ranked in the database.
+
+        Unlike similarity_search_with_score, which returns full rows
+        (including each 1024-dim embedding), this selects only item IDs and
+        distances. The HNSW candidate list is widened for large k.
+
+        Args:
+            query_vector: Query embedding
+            k: Number of results to return
+            user_id: Optional user ID filter
+
+        Returns:
+            List of (item_id, cosine distance) tuples, nearest first
+        """
+        sql = """
+            SELECT e.cmetadata->>'item_id' AS item_id,
+                   e.embedding <=> :query_vector AS distance
+            FROM langchain_pg_embedding e
+            JOIN langchain_pg_collection c ON e.collection_id = c.uuid
+            WHERE c.name = :collection_name
+        """
+        params = {
+            "query_vector": query_vector,
+            "collection_name": self.collection_name,
+            "k": k
+        }
+        if user_id:
+            sql += " AND e.cmetadata->>'user_id' = :user_id"
+            params["user_id"] = user_id
+        sql += " ORDER BY distance LIMIT :k"
+
+        stmt = text(sql).bindparams(
+            bindparam("query_vector", type_=Vector(len(query_vector)))
+        )
+
+        try:
+            with self.vectorstore._make_sync_session() as session:
+                ef_search = max(k * 4, self.ef_search)
+                # Behind PgBouncer the startup option is dropped, so always set it
+                if ef_search != self.ef_search or self.pgbouncer:
+                    session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+                rows = session.execute(stmt, params).all()
+            return [(row.item_id, float(row.distance)) for row in rows]
+        except Exception as e:
+            logger.error(f"Vector search failed: {e}")
+            return []
+
     def as_retriever(self, search_kwargs: Optional[dict] = None):
         """Get retriever interface for use in chains.
 
@@ -239,13 +377,12 @@ class PGVectorStoreManager:
             Dictionary with collection stats
         """
         try:
-            # Query document count from PostgreSQL
-            with self.vectorstore._make_session() as session:
-                from sqlalchemy import text
-                result = session.execute(
-                    text(f"SELECT COUNT(*) FROM {self.collection_name}")
-                )
-                count = result.scalar()
+            # Count this collection's rows in langchain_pg_embedding (the
+            # collection is a row in langchain_pg_collection, not a table)
+            with self.vectorstore._make_sync_session() as session:
+                count = session.execute(
+                    _COLLECTION_COUNT_STMT, {"name": self.collection_name}
+                ).scalar()
 
             return {
                 "collection_name": self.collection_name,
@@ -2,8 +2,8 @@
 """
 Regenerate embeddings using PGVectorStoreManager (langchain-postgres).
 
-This script generates embeddings for all analyses and stores them in the
-langchain_pg_embedding table (where search queries read from).
+This script generates embeddings for the latest analysis of every item and
+stores them in the langchain_pg_embedding table (where search queries read from).
 
 IMPORTANT: This replaces regenerate_embeddings_pgvector.py which incorrectly
 wrote to the 'embeddings' ORM table instead of 'langchain_pg_embedding'.
@@ -32,6 +32,7 @@ from database_orm.connection import init_connection, get_session, close_connecti
 from database_orm.models import Analysis, Item
 from retrieval.pgvector_store import PGVectorStoreManager
 from sqlalchemy import text, select
+from sqlalchemy.orm import aliased
 
 # Import VoyageAI
 try:
@@ -130,15 +131,26 @@ def regenerate_embeddings(
     engine = init_connection()
 
     with get_session() as session:
-        # Build query for analyses
-        query = select(Analysis).join(Item, Analysis.item_id == Item.id)
+        # Only the latest analysis per item: embeddings are keyed by item_id,
+        # so older versions would collide in one batch's upsert or be
+        # embedded only to be overwritten by a later batch
+        newer = aliased(Analysis)
+        query = (
+            select(Analysis, Item)
+            .join(Item, Analysis.item_id == Item.id)
+            .where(
+                ~select(newer.id)
+                .where(newer.item_id == Analysis.item_id, newer.version > Analysis.version)
+                .exists()
+            )
+        )
 
         if user_id:
             query = query.where(Analysis.user_id == user_id)
 
         query = query.order_by(Analysis.created_at)
 
-        analyses = session.execute(query).scalars().all()
+        analyses = session.execute(query).all()
 
         if not analyses:
             print("✓ No analyses found to process.")
@@ -168,37 +180,33 @@ def regenerate_embeddings(
 
             print(f"Processing batch {batch_num}/{total_batches} ({len(batch)} analyses)...")
 
-            # Process each analysis in batch
-            for analysis in batch:
+            # Collect the batch so it is embedded and inserted in one call
+            records = []
+            for analysis, item in batch:
+                # Get text for embedding
+                text_content = get_text_for_embedding(analysis)
+                if not text_content.strip():
+                    print(f"  ⚠ Skipping analysis {analysis.id[:8]}... (no text content)")
+                    stats['skipped'] += 1
+                    continue
+
+                records.append({
+                    "item_id": analysis.item_id,
+                    "raw_response": analysis.raw_response or {},
+                    "filename": item.filename or item.file_path or f"item_{analysis.item_id[:8]}",
+                    "user_id": analysis.user_id,
+                })
+
+            if records:
                 try:
-                    # Get text for embedding
-                    text_content = get_text_for_embedding(analysis)
-                    if not text_content.strip():
-                        print(f"  ⚠ Skipping analysis {analysis.id[:8]}... (no text content)")
-                        stats['skipped'] += 1
-                        continue
-
-                    # Get item for filename
-                    item = session.get(Item, analysis.item_id)
-                    if not item:
-                        print(f"  ⚠ Skipping analysis {analysis.id[:8]}... (no item found)")
-                        stats['skipped'] += 1
-                        continue
-
-                    # Use PGVectorStoreManager.add_document()
+                    # Use PGVectorStoreManager.add_documents_bulk()
                     # This writes to langchain_pg_embedding table (correct!)
-                    doc_id = vector_store_manager.add_document(
-                        item_id=analysis.item_id,
-                        raw_response=analysis.raw_response or {},
-                        filename=item.filename or item.file_path or f"item_{analysis.item_id[:8]}",
-                        user_id=analysis.user_id
-                    )
-
-                    stats['embedded'] += 1
+                    vector_store_manager.add_documents_bulk(records, batch_size=batch_size)
+                    stats['embedded'] += len(records)
 
                 except Exception as e:
-                    print(f"  ✗ Error processing {analysis.id[:8]}...: {e}")
-                    stats['errors'] += 1
+                    print(f"  ✗ Error processing batch {batch_num}: {e}")
+                    stats['errors'] += len(records)
 
             print(f"  ✓ Processed batch {batch_num}/{total_batches}")
             print()
@@ -0,0 +1,592 @@
+"""
+Unit tests for the SQLAlchemy data-access layer.
+
+Uses an in-memory SQLite database so the dialect-agnostic query paths
+(bulk lookups, versioning, pagination) run without PostgreSQL. Full-text
+search paths that rely on tsvector are covered by the retrieval tests.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from database_orm.connection import init_connection, close_connection
+from database_orm.models import Base
+
+import database_sqlalchemy as db
+
+
+USER_ID = "user-1"
+OTHER_USER_ID = "user-2"
+
+
+@pytest.fixture(autouse=True)
+def database():
+    """Initialize an in-memory SQLite database for each test."""
+    close_connection()
+    engine = init_connection("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    yield engine
+    close_connection()
+
+
+def _make_item(item_id: str, user_id: str = USER_ID) -> dict:
+    return db.create_item(
+        item_id=item_id,
+        filename=f"{item_id}.jpg",
+        original_filename=f"{item_id}.jpg",
+        file_path=f"/data/{item_id}.jpg",
+        file_size=1024,
+        mime_type="image/jpeg",
+        user_id=user_id,
+    )
+
+
+def _make_analysis(analysis_id: str, item_id: str, category: str = "Food", user_id: str = USER_ID) -> dict:
+    return db.create_analysis(
+        analysis_id=analysis_id,
+        item_id=item_id,
+        user_id=user_id,
+        result={"category": category, "summary": f"Summary {analysis_id}"},
+        provider_used="anthropic",
+        model_used="claude",
+    )
+
+
+class TestBulkReads:
+    """Test get_items_bulk / get_latest_analyses_bulk."""
+
+    def test_get_items_bulk_preserves_order(self):
+        for item_id in ["a", "b", "c"]:
+            _make_item(item_id)
+
+        result = db.get_items_bulk(["c", "missing", "a", "c"], user_id=USER_ID)
+
+        assert list(result.keys()) == ["c", "a"]
+        assert result["a"]["filename"] == "a.jpg"
+
+    def test_get_items_bulk_enforces_user(self):
+        _make_item("a")
+        _make_item("b", user_id=OTHER_USER_ID)
+
+        result = db.get_items_bulk(["a", "b"], user_id=USER_ID)
+
+        assert list(result.keys()) == ["a"]
+
+    def test_get_items_bulk_chunks_large_inputs(self, monkeypatch):
+        monkeypatch.setattr(db, "_IN_CLAUSE_CHUNK_SIZE", 2)
+        for item_id in ["a", "b", "c", "d", "e"]:
+            _make_item(item_id)
+
+        result = db.get_items_bulk(["e", "d", "c", "b", "a"], user_id=USER_ID)
+
+        assert list(result.keys()) == ["e", "d", "c", "b", "a"]
+
+    def test_get_latest_analyses_bulk(self):
+        _make_item("a")
+        _make_item("b")
+        _make_item("c")
+        _make_analysis("a-1", "a")
+        _make_analysis("a-2", "a", category="Travel")
+        _make_analysis("b-1", "b")
+
+        result = db.get_latest_analyses_bulk(["a", "b", "c"], user_id=USER_ID)
+
+        assert list(result.keys()) == ["a", "b"]
+        assert result["a"]["id"] == "a-2"
+        assert result["a"]["version"] == 2
+        assert result["b"]["version"] == 1
+
+    def test_bulk_reads_empty_input(self):
+        assert db.get_items_bulk([], user_id=USER_ID) == {}
+        assert db.get_latest_analyses_bulk([], user_id=USER_ID) == {}
+
+    def test_batch_get_items_with_analyses_uses_latest(self):
+        _make_item("a")
+        _make_item("b")
+        _make_analysis("a-1", "a")
+        _make_analysis("a-2", "a", category="Travel")
+
+        result = db.batch_get_items_with_analyses(["a", "b"], user_id=USER_ID)
+
+        assert result["a"]["analysis"]["id"] == "a-2"
+        assert result["b"]["analysis"] is None
+
+
+class TestBatchWrite:
+    """Test batch_write transactional helper."""
+
+    def test_batch_write_commits_once(self):
+        with db.batch_write(USER_ID) as batch:
+            batch.create_item("a", "a.jpg", "a.jpg", "/data/a.jpg", 10, "image/jpeg")
+            batch.create_analysis("a-1", "a", {"category": "Food"}, "anthropic", "claude")
+            second = batch.create_analysis("a-2", "a", {"category": "Food"}, "anthropic", "claude")
+
+        assert second["version"] == 2
+        assert db.get_item("a", user_id=USER_ID) is not None
+        assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-2"
+
+    def test_batch_write_rolls_back_on_error(self):
+        with pytest.raises(ValueError):
+            with db.batch_write(USER_ID) as batch:
+                batch.create_item("a", "a.jpg", "a.jpg", "/data/a.jpg", 10, "image/jpeg")
+                raise ValueError("boom")
+
+        assert db.get_item("a", user_id=USER_ID) is None
+
+
+class TestBulkCreateItems:
+    """Test bulk_create_items batching."""
+
+    def test_returns_items_in_input_order(self):
+        rows = [
+            {"item_id": item_id, "filename": f"{item_id}.jpg", "original_filename": None,
+             "file_path": f"/data/{item_id}.jpg", "file_size": 1, "mime_type": "image/jpeg"}
+            for item_id in ["c", "a", "b"]
+        ]
+
+        created = db.bulk_create_items(rows, user_id=USER_ID)
+
+        assert [item["id"] for item in created] == ["c", "a", "b"]
+        assert all(item["created_at"] for item in created)
+        assert db.get_item("a", user_id=USER_ID) == created[1]
+
+    def test_copy_path_returns_item_dicts(self, monkeypatch):
+        # Stand in for COPY on SQLite; the result is built from the row values
+        monkeypatch.setattr(db, "is_postgres", lambda: True)
+        monkeypatch.setattr(db.bulk, "COPY_THRESHOLD", 1)
+        monkeypatch.setattr(db.bulk, "bulk_insert", lambda s, model, rows: s.execute(insert(model), rows))
+        rows = [
+            {"item_id": item_id, "filename": f"{item_id}.jpg", "original_filename": None,
+             "file_path": f"/data/{item_id}.jpg", "file_size": 1, "mime_type": "image/jpeg"}
+            for item_id in ["b", "a"]
+        ]
+
+        created = db.bulk_create_items(rows, user_id=USER_ID)
+
+        stored = db.get_item("a", user_id=USER_ID)
+        assert created[1] == stored
+        assert list(created[1]) == list(stored)
+
+    def test_empty_rows(self):
+        assert db.bulk_create_items([], user_id=USER_ID) == []
+
+
+class TestBulkCreateAnalyses:
+    """Test bulk_create_analyses versioning and batching."""
+
+    def test_assigns_versions_after_existing(self):
+        _make_item("a")
+        _make_item("b")
+        _make_analysis("a-1", "a")
+
+        created = db.bulk_create_analyses(
+            [
+                {"analysis_id": "a-2", "item_id": "a", "result": {"category": "Food"},
+                 "provider_used": "anthropic", "model_used": "test-model"},
+                {"analysis_id": "b-1", "item_id": "b", "result": {"category": "Travel"},
+                 "provider_used": "anthropic", "model_used": "test-model"},
+                {"analysis_id": "a-3", "item_id": "a", "result": {"category": "Art"},
+                 "provider_used": "anthropic", "model_used": "test-model"},
+            ],
+            user_id=USER_ID,
+        )
+
+        assert [(a["id"], a["version"]) for a in created] == [("a-2", 2), ("b-1", 1), ("a-3", 3)]
+        assert db.get_latest_analysis("a", user_id=USER_ID)["category"] == "Art"
+        assert db.get_latest_analysis("b", user_id=USER_ID)["version"] == 1
+
+    def test_copy_path_returns_analysis_dicts(self, monkeypatch):
+        # Stand in for COPY on SQLite; the result is built from the row values
+        monkeypatch.setattr(db, "is_postgres", lambda: True)
+        monkeypatch.setattr(db.bulk, "COPY_THRESHOLD", 1)
+        monkeypatch.setattr(db.bulk, "bulk_insert", lambda s, model, rows: s.execute(insert(model), rows))
+        _make_item("a")
+
+        created = db.bulk_create_analyses(
+            [{"analysis_id": "a-1", "item_id": "a", "result": {"category": "Food"},
+              "provider_used": "anthropic", "model_used": "test-model"}],
+            user_id=USER_ID,
+        )
+
+        stored = db.get_latest_analysis("a", user_id=USER_ID)
+        assert created[0] == stored
+        assert list(created[0]) == list(stored)
+
+    def test_empty_rows(self):
+        assert db.bulk_create_analyses([], user_id=USER_ID) == []
+
+    def test_in_batch_write(self):
+        with db.batch_write(USER_ID) as batch:
+            batch.create_item("a", "a.jpg", "a.jpg", "/tmp/a.jpg", 1, "image/jpeg")
+            batch.bulk_create_analyses([
+                {"analysis_id": "a-1", "item_id": "a", "result": {},
+                 "provider_used": "anthropic", "model_used": "test-model"},
+            ])
+
+        assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-1"
+
+
+class TestReadCache:
+    """Test the opt-in get_item / get_latest_analysis cache."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, monkeypatch):
+        from cachetools import TTLCache
+
+        monkeypatch.setattr(db, "_item_cache", TTLCache(maxsize=16, ttl=60))
+        monkeypatch.setattr(db, "_latest_analysis_cache", TTLCache(maxsize=16, ttl=60))
+
+    def test_get_item_served_from_cache(self, monkeypatch):
+        _make_item("a")
+        first = db.get_item("a", user_id=USER_ID)
+
+        monkeypatch.setattr(db, "read_only_session", None)  # any DB access would fail
+        assert db.get_item("a", user_id=USER_ID) == first
+
+    def test_cached_value_is_copied(self):
+        _make_item("a")
+        db.get_item("a", user_id=USER_ID)["filename"] = "mutated"
+
+        assert db.get_item("a", user_id=USER_ID)["filename"] == "a.jpg"
+
+    def test_create_analysis_invalidates_latest(self):
+        _make_item("a")
+        _make_analysis("a-1", "a")
+        assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-1"
+
+        _make_analysis("a-2", "a")
+        assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-2"
+
+    def test_delete_item_invalidates(self):
+        _make_item("a")
+        assert db.get_item("a", user_id=USER_ID) is not None
+
+        db.delete_item("a", user_id=USER_ID)
+        assert db.get_item("a", user_id=USER_ID) is None
+
+
+class TestRequestScope:
+    """Test the per-request identity map."""
+
+    def test_repeated_reads_hit_database_once(self, monkeypatch):
+        _make_item("a")
+        _make_analysis("a-1", "a")
+        calls = []
+        real_session = db.read_only_session
+
+        def counting_session():
+            calls.append(1)
+            return real_session()
+
+        monkeypatch.setattr(db, "read_only_session", counting_session)
+
+        with db.request_scope():
+            for _ in range(3):
+                assert db.get_item("a", user_id=USER_ID)["id"] == "a"
+                assert db.get_analysis("a-1", user_id=USER_ID)["id"] == "a-1"
+                assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-1"
+
+        assert len(calls) == 3
+
+    def test_writes_invalidate_scope(self):
+        _make_item("a")
+        _make_analysis("a-1", "a")
+
+        with db.request_scope():
+            assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-1"
+            _make_analysis("a-2", "a")
+            assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-2"
+
+            db.delete_item("a", user_id=USER_ID)
+            assert db.get_item("a", user_id=USER_ID) is None
+            assert db.get_analysis("a-1", user_id=USER_ID) is None
+
+    def test_no_caching_outside_scope(self):
+        _make_item("a")
+
+        with db.request_scope():
+            db.get_item("a", user_id=USER_ID)
+        db.delete_item("a", user_id=USER_ID)
+
+        assert db.get_item("a", user_id=USER_ID) is None
+
+
+class TestIterItems:
+    """Test streaming iter_items."""
+
+    def test_iter_items_streams_all_rows(self):
+        for item_id in ["a", "b", "c"]:
+            _make_item(item_id)
+        _make_item("x", user_id=OTHER_USER_ID)
+
+        ids = [item["id"] for item in db.iter_items(user_id=USER_ID, chunk_size=1)]
+
+        assert sorted(ids) == ["a", "b", "c"]
+
+    def test_iter_items_category_filter(self):
+        _make_item("a")
+        _make_item("b")
+        _make_analysis("a-1", "a", category="Food")
+        _make_analysis("a-2", "a", category="Food")
+        _make_analysis("b-1", "b", category="Travel")
+
+        ids = [item["id"] for item in db.iter_items(user_id=USER_ID, category="Food")]
+
+        assert ids == ["a"]
+
+    def test_iter_item_analyses_matches_get_item_analyses(self):
+        _make_item("a")
+        for analysis_id in ["a-1", "a-2", "a-3"]:
+            _make_analysis(analysis_id, "a")
+
+        streamed = list(db.iter_item_analyses("a", user_id=USER_ID, chunk_size=1))
+
+        assert streamed == db.get_item_analyses("a", user_id=USER_ID)
+        assert [a["version"] for a in streamed] == [3, 2, 1]
+
+
+class TestListItems:
+    """Test list_items pagination over column rows."""
+
+    def test_rows_match_get_item(self):
+        _make_item("a")
+        _make_item("b")
+        _make_analysis("a-1", "a", category="Food")
+        _make_analysis("b-1", "b", category="Travel")
+
+        items = db.list_items(user_id=USER_ID)
+        food = db.list_items(user_id=USER_ID, category="Food")
+
+        assert sorted(item["id"] for item in items) == ["a", "b"]
+        assert food == [db.get_item("a", user_id=USER_ID)]
+
+    def test_pagination(self):
+        for item_id in ["a", "b", "c"]:
+            _make_item(item_id)
+
+        first = db.list_items(user_id=USER_ID, limit=2)
+        rest = db.list_items(user_id=USER_ID, limit=2, offset=2)
+
+        assert len(first) == 2
+        assert len(rest) == 1
+        assert {i["id"] for i in first + rest} == {"a", "b", "c"}
+
+    def test_keyset_pagination(self):
+        # Same-second created_at values exercise the id tie-breaker
+        for item_id in ["a", "b", "c", "d", "e"]:
+            _make_item(item_id)
+
+        pages = []
+        after_id = None
+        while True:
+            page = db.list_items(user_id=USER_ID, limit=2, after_id=after_id)
+            if not page:
+                break
+            pages.append([item["id"] for item in page])
+            after_id = page[-1]["id"]
+
+        assert [i for page in pages for i in page] == [i["id"] for i in db.list_items(user_id=USER_ID)]
+        assert len(pages) == 3
+
+
+class TestCachedStatements:
+    """Test lambda_stmt reads bind fresh values on every call."""
+
+    def test_count_items(self):
+        _make_item("a")
+        _make_item("b")
+        _make_item("c", user_id=OTHER_USER_ID)
+        _make_analysis("a-1", "a", category="Food")
+        _make_analysis("b-1", "b", category="Travel")
+
+        assert db.count_items(user_id=USER_ID) == 2
+        assert db.count_items(user_id=OTHER_USER_ID) == 1
+        assert db.count_items(user_id=USER_ID, category="Food") == 1
+        assert db.count_items(user_id=USER_ID, category="Art") == 0
+
+    def test_get_item_analyses(self):
+        _make_item("a")
+        _make_item("b")
+        _make_analysis("a-1", "a")
+        _make_analysis("a-2", "a")
+        _make_analysis("b-1", "b")
+
+        assert [a["id"] for a in db.get_item_analyses("a", user_id=USER_ID)] == ["a-2", "a-1"]
+        assert [a["id"] for a in db.get_item_analyses("b", user_id=USER_ID)] == ["b-1"]
+
+
+class TestDeleteItems:
+    """Test batched delete_items."""
+
+    def test_deletes_only_own_items(self):
+        _make_item("a")
+        _make_item("b")
+        _make_item("c", user_id=OTHER_USER_ID)
+        _make_analysis("a-1", "a")
+
+        deleted = db.delete_items(["a", "b", "c", "missing"], user_id=USER_ID)
+
+        assert sorted(deleted) == ["a", "b"]
+        assert db.get_item("a", user_id=USER_ID) is None
+        assert db.get_item_analyses("a", user_id=USER_ID) == []
+        assert db.get_item("c", user_id=OTHER_USER_ID) is not None
+
+    def test_delete_item_reports_missing(self):
+        _make_item("a")
+
+        assert db.delete_item("a", user_id=USER_ID) is True
+        assert db.delete_item("a", user_id=USER_ID) is False
+
+
+class TestSearchStatus:
+    """Test get_search_status counts."""
+
+    def test_counts(self):
+        _make_item("a")
+        _make_item("b")
+        _make_analysis("a-1", "a")
+
+        status = db.get_search_status()
+
+        # search_vector is generated by PostgreSQL only, so SQLite indexes nothing
+        assert status["total_items"] == 2
+        assert status["items_with_analysis"] == 1
+        assert status["items_without_analysis"] == 1
+        assert status["doc_count"] == 0
+
+
+class TestSearchItemsByFilename:
+    """Test search_items_by_filename substring matching."""
+
+    def test_case_insensitive_substring(self):
+        _make_item("beach-sunset")
+        _make_item("city-night")
+        _make_item("sunset-other-user", user_id="other-user")
+
+        results = db.search_items_by_filename("SUNSET", user_id=USER_ID)
+
+        assert [item["id"] for item in results] == ["beach-sunset"]
+
+    def test_wildcards_are_literal(self):
+        _make_item("a_b")
+        _make_item("axb")
+
+        results = db.search_items_by_filename("a_b", user_id=USER_ID)
+
+        assert [item["id"] for item in results] == ["a_b"]
+
+
+class TestSearchItemsFuzzy:
+    """Test trigram search on PostgreSQL (set TEST_POSTGRES_URL to run)."""
+
+    @pytest.fixture(autouse=True)
+    def database(self):
+        """Override the SQLite database with a PostgreSQL one."""
+        url = os.getenv("TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("TEST_POSTGRES_URL not set")
+        close_connection()
+        engine = init_connection(url)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
+        Base.metadata.create_all(engine)
+        yield engine
+        Base.metadata.drop_all(engine)
+        close_connection()
+
+    def test_min_similarity_below_server_default(self):
+        # word_similarity('sunrise', 'sunset ...') is 0.375: above the 0.3
+        # default but below pg_trgm's own 0.6 threshold
+        _make_item("a")
+        db.create_analysis(
+            analysis_id="a-1",
+            item_id="a",
+            user_id=USER_ID,
+            result={"category": "Travel", "summary": "sunset over the beach"},
+            provider_used="anthropic",
+            model_used="claude",
+        )
+
+        results = db.search_items_fuzzy("sunrise", user_id=USER_ID)
+
+        assert [item_id for item_id, _ in results] == ["a"]
+        assert 0.3 <= results[0][1] < 0.6
+        assert db.search_items_fuzzy("sunrise", user_id=USER_ID, min_similarity=0.5) == []
+
+    def test_fills_top_k_with_qualifying_rows(self):
+        for n in range(3):
+            _make_item(f"item-{n}")
+            db.create_analysis(
+                analysis_id=f"item-{n}-1",
+                item_id=f"item-{n}",
+                user_id=USER_ID,
+                result={"category": "Travel", "summary": "sunset over the beach"},
+                provider_used="anthropic",
+                model_used="claude",
+            )
+
+        assert len(db.search_items_fuzzy("sunrise", user_id=USER_ID, top_k=2)) == 2
+
+
+class TestListItemsWithLatestAnalysis:
+    """Test eager loading of the latest analysis per item."""
+
+    def test_returns_latest_version_per_item(self):
+        _make_item("a")
+        _make_item("b")
+        _make_item("c")
+        _make_analysis("a-1", "a", category="Food")
+        _make_analysis("a-2", "a", category="Travel")
+        _make_analysis("b-1", "b", category="Food")
+
+        items = {
+            item["id"]: item
+            for item in db.list_items_with_latest_analysis(user_id=USER_ID)
+        }
+
+        assert items["a"]["latest_analysis"]["id"] == "a-2"
+        assert items["a"]["latest_analysis"]["version"] == 2
+        assert items["b"]["latest_analysis"]["id"] == "b-1"
+        assert items["c"]["latest_analysis"] is None
+
+    def test_one_query_for_all_analyses(self, database):
+        for item_id in ["a", "b", "c"]:
+            _make_item(item_id)
+            _make_analysis(f"{item_id}-1", item_id)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(database, "before_cursor_execute", record)
+        try:
+            db.list_items_with_latest_analysis(user_id=USER_ID)
+        finally:
+            event.remove(database, "before_cursor_execute", record)
+
+        assert len(statements) == 2
+
+
+class TestSingleRowReads:
+    """Test cached-statement single-row lookups bind fresh values per call."""
+
+    def test_get_item_binds_each_call(self):
+        _make_item("a")
+        _make_item("b")
+
+        assert db.get_item("a", user_id=USER_ID)["id"] == "a"
+        assert db.get_item("b", user_id=USER_ID)["id"] == "b"
+        assert db.get_item("a", user_id=OTHER_USER_ID) is None
+
+    def test_get_analysis_and_latest(self):
+        _make_item("a")
+        _make_analysis("a-1", "a")
+        _make_analysis("a-2", "a")
+
+        assert db.get_analysis("a-1", user_id=USER_ID)["version"] == 1
+        assert db.get_latest_analysis("a", user_id=USER_ID)["id"] == "a-2"
+        assert db.get_analysis("a-1", user_id=OTHER_USER_ID) is None
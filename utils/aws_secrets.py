@@ -23,6 +23,19 @@ except ImportError:
     logger.warning("boto3 not available - AWS Secrets Manager integration disabled")
 
 
+@lru_cache(maxsize=1)
+def _secrets_client():
+    """Create the Secrets Manager client once per process."""
+    # Short timeout for Lambda init/first request
+    from botocore.config import Config
+    boto_config = Config(
+        connect_timeout=3,  # 3 seconds to establish connection
+        read_timeout=5,     # 5 seconds to read response
+        retries={'max_attempts': 1}  # Don't retry on timeout
+    )
+    return boto3.client('secretsmanager', config=boto_config)
+
+
 @lru_cache(maxsize=1)
 def get_database_credentials() -> Dict[str, str]:
     """
@@ -60,14 +73,7 @@ def get_database_credentials() -> Dict[str, str]:
         )
 
     try:
-        # Create client with short timeout for Lambda init/first request
-        from botocore.config import Config
-        boto_config = Config(
-            connect_timeout=3,  # 3 seconds to establish connection
-            read_timeout=5,     # 5 seconds to read response
-            retries={'max_attempts': 1}  # Don't retry on timeout
-        )
-        client = boto3.client('secretsmanager', config=boto_config)
+        client = _secrets_client()
         response = client.get_secret_value(SecretId=secret_arn)
 
         # Parse the secret JSON